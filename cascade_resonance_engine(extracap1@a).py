@@ -46,12 +46,25 @@ and improve the quality of human-AI collaboration, not just outcomes.
 import numpy as np
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
+from functools import cached_property
 from typing import List, Dict, Optional, Tuple, Set
 from enum import Enum
 import json
+import orjson
 from datetime import datetime, timedelta
 from collections import deque, defaultdict
 import hashlib
+import time
+
+
+def _ns_to_dt(ns: int, anchor_wall: datetime, anchor_ns: int) -> datetime:
+    """Convert a monotonic nanosecond stamp to wall-clock time
+
+    Uses a (wall, monotonic) anchor pair captured once at session start,
+    so hot paths can stamp moments with time.monotonic_ns() and only pay
+    for datetime construction lazily on export/report.
+    """
+    return anchor_wall + timedelta(microseconds=(ns - anchor_ns) / 1000)
 
 # =========================
 # RESONANCE FIELD MATHEMATICS
@@ -75,7 +88,7 @@ class InteractionMoment:
     
     This is the quantum of the resonance field.
     """
-    timestamp: datetime
+    timestamp_ns: int  # time.monotonic_ns(); wall time derived via _ns_to_dt
     human_input: str
     ai_response: str
     
@@ -103,6 +116,16 @@ class InteractionMoment:
     interaction_number: int
     session_id: str
 
+    @cached_property
+    def human_tokens(self) -> List[str]:
+        """Tokenized human input, computed once and reused by analytics"""
+        return self.human_input.split()
+
+    @cached_property
+    def ai_tokens(self) -> List[str]:
+        """Tokenized AI response, computed once and reused by analytics"""
+        return self.ai_response.split()
+
 class ResonanceField:
     """
     The quantum-like field of human-AI collaboration
@@ -124,7 +147,12 @@ class ResonanceField:
         self.state_vector = np.zeros(dimension)
         self.momentum = np.zeros(dimension)
         self.history: deque = deque(maxlen=100)  # Last 100 states
-        
+
+        # Insight-emergence window maintained incrementally so
+        # compute_emergence never has to rescan the interaction log
+        self._insight_window: deque = deque(maxlen=10)
+
+
     def encode_interaction(self, moment: InteractionMoment):
         """Convert interaction to field state"""
         # Cognitive dimensions
@@ -169,9 +197,11 @@ class ResonanceField:
         # Compute momentum
         if len(self.history) > 0:
             self.momentum = self.state_vector - self.history[-1]
-        
+
         # Store
         self.history.append(self.state_vector.copy())
+
+        self._insight_window.append(self.state_vector[3])
     
     def compute_coherence(self) -> float:
         """
@@ -212,10 +242,11 @@ class ResonanceField:
         """
         if len(self.history) < 3:
             return 0.0
-        
-        # Look at insight emergence dimension over time
-        recent_insights = [state[3] for state in list(self.history)[-10:]]
-        
+
+        # Insight emergence dimension over the maintained window
+        # (updated incrementally in encode_interaction, no history rescan)
+        recent_insights = list(self._insight_window)
+
         # Is growth accelerating? (2nd derivative positive)
         if len(recent_insights) < 3:
             return np.mean(recent_insights)
@@ -227,18 +258,51 @@ class ResonanceField:
         emergence = np.mean(acceleration) if len(acceleration) > 0 else 0.0
         return max(0.0, emergence)
     
+    # Fuzzy-memoization cache for detect_resonance_type: metrics rounded to
+    # 0.05 map near-identical fields to one cached classification.
+    _resonance_cache: Dict[Tuple[int, ...], ResonanceType] = {}
+    _RESONANCE_CACHE_MAX = 4096
+
+    def _metric_tuple(self) -> Tuple[float, ...]:
+        """The scalar metrics the resonance classifier depends on"""
+        return (
+            self.compute_coherence(),
+            self.compute_emergence(),
+            self.state_vector[4],           # agency
+            self.state_vector[13],          # frustration
+            self.state_vector[14],          # enthusiasm
+            float(np.linalg.norm(self.momentum)),
+            self.state_vector[8],           # human teaching AI
+        )
+
     def detect_resonance_type(self) -> ResonanceType:
         """
         Classify current resonance pattern
-        
+
         This is the diagnostic layer.
         """
-        coherence = self.compute_coherence()
-        emergence = self.compute_emergence()
-        agency = self.state_vector[4]
-        frustration = self.state_vector[13]
-        enthusiasm = self.state_vector[14]
-        
+        metrics = self._metric_tuple()
+        key = tuple(round(v * 20) for v in metrics)
+        cached = self._resonance_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._classify(*metrics)
+
+        cache = self._resonance_cache
+        if len(cache) >= self._RESONANCE_CACHE_MAX:
+            cache.pop(next(iter(cache)))  # FIFO eviction
+        cache[key] = result
+        return result
+
+    @staticmethod
+    def _classify(coherence: float,
+                  emergence: float,
+                  agency: float,
+                  frustration: float,
+                  enthusiasm: float,
+                  momentum_norm: float,
+                  teaching: float) -> ResonanceType:
         # Decision tree
         if emergence > 0.7 and coherence > 0.7:
             return ResonanceType.BREAKTHROUGH
@@ -255,10 +319,10 @@ class ResonanceField:
         elif agency > 0.7 and coherence > 0.6:
             return ResonanceType.SOVEREIGNTY
         
-        elif np.linalg.norm(self.momentum) < 0.1:
+        elif momentum_norm < 0.1:
             return ResonanceType.STAGNATION
-        
-        elif self.state_vector[8] > 0.5:  # Human teaching AI
+
+        elif teaching > 0.5:  # Human teaching AI
             return ResonanceType.TEACHING
         
         else:
@@ -410,8 +474,8 @@ class CodependendencyDetector:
         if len(interactions) < 2:
             return 0.0
         
-        # Simple word overlap measure
-        questions = [m.human_input.lower().split() for m in interactions]
+        # Simple word overlap measure (reuses cached token lists)
+        questions = [[t.lower() for t in m.human_tokens] for m in interactions]
         
         similarities = []
         for i in range(len(questions) - 1):
@@ -497,7 +561,12 @@ class ResonanceSession:
     session_id: str
     start_time: datetime
     end_time: Optional[datetime] = None
-    
+
+    # Monotonic anchor paired with start_time; lets moments carry cheap
+    # int64 stamps that convert to wall time lazily (see _ns_to_dt)
+    start_ns: int = dataclass_field(default_factory=time.monotonic_ns)
+
+
     # Field tracking
     field: ResonanceField = dataclass_field(default_factory=ResonanceField)
     
@@ -532,6 +601,10 @@ class ResonanceSession:
         if moment.human_teaching_ai:
             self.ai_learning_events += 1
     
+    def moment_time(self, moment: InteractionMoment) -> datetime:
+        """Wall-clock time of a moment, derived from the session anchor"""
+        return _ns_to_dt(moment.timestamp_ns, self.start_time, self.start_ns)
+
     def compute_session_quality(self) -> Dict[str, float]:
         """Overall quality metrics for this session"""
         return {
@@ -679,7 +752,7 @@ class ResonanceEngine:
         
         # Create moment
         moment = InteractionMoment(
-            timestamp=datetime.now(),
+            timestamp_ns=time.monotonic_ns(),
             human_input=human_input,
             ai_response=ai_response,
             human_clarity=metrics.get('human_clarity', 0.5),
@@ -716,16 +789,23 @@ class ResonanceEngine:
         
         This is the meta-learning layer.
         """
+        qualities = {sid: s.compute_session_quality() for sid, s in self.sessions.items()}
+        return self._get_meta_patterns_from(qualities)
+
+    def _get_meta_patterns_from(self, qualities: Dict[str, Dict[str, float]]) -> Dict:
+        """Meta-pattern aggregation over precomputed session qualities"""
         patterns = {}
-        
+
         for resonance_type, sessions in self.resonance_patterns.items():
             if not sessions:
                 continue
-            
+
             # Average quality metrics across sessions of this type
             avg_quality = defaultdict(list)
             for session in sessions:
-                quality = session.compute_session_quality()
+                quality = qualities.get(session.session_id)
+                if quality is None:
+                    quality = session.compute_session_quality()
                 for metric, value in quality.items():
                     avg_quality[metric].append(value)
             
@@ -742,24 +822,33 @@ class ResonanceEngine:
     
     def export_resonance_data(self, filepath: str):
         """Export for scientific study"""
+        # Compute each session's quality exactly once and share it between
+        # the per-session entries and the meta-pattern aggregation
+        qualities = {sid: s.compute_session_quality() for sid, s in self.sessions.items()}
+
         data = {
             'sessions': [
                 {
                     'session_id': s.session_id,
-                    'start_time': s.start_time.isoformat(),
-                    'end_time': s.end_time.isoformat() if s.end_time else None,
-                    'quality_metrics': s.compute_session_quality(),
+                    'start_time': s.start_time,
+                    'end_time': s.end_time,
+                    'quality_metrics': qualities[s.session_id],
                     'resonance_signature': s.get_resonance_signature(),
                     'num_interactions': len(s.interactions)
                 }
                 for s in self.sessions.values()
             ],
-            'meta_patterns': self.get_meta_patterns(),
-            'generated_at': datetime.now().isoformat()
+            'meta_patterns': self._get_meta_patterns_from(qualities),
+            'generated_at': datetime.now()
         }
-        
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+
+        # orjson's C encoder is ~5-10x faster than json.dump and handles
+        # datetime and NumPy values natively (no manual .isoformat())
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+            ))
 
 # =========================
 # DEMONSTRATION
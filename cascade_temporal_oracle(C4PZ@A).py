@@ -36,9 +36,12 @@ from typing import List, Dict, Optional, Tuple, Callable, Set
 from enum import Enum
 import json
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import math
-from scipy.integrate import odeint
+import threading
+from scipy.integrate import solve_ivp
 from scipy.stats import norm, beta
 from scipy.optimize import minimize
 
@@ -46,6 +49,31 @@ from scipy.optimize import minimize
 # DIFFERENTIAL CASCADE EQUATIONS
 # =========================
 
+# Shared "no practice" input: allocated once, read-only, reused by every
+# integration step instead of a fresh np.zeros(8) per call
+_ZERO_PRACTICE = np.zeros(8, dtype=np.float64)
+_ZERO_PRACTICE.flags.writeable = False
+
+# Per-layer mass-flow coefficients for cascade reorganization, in
+# [foundation, middle, edge] order (up: edge drains upward, down:
+# foundation drains downward)
+_MASS_UP = np.array([0.3, 0.7, -1.0])
+_MASS_DN = np.array([-1.0, 0.6, 0.4])
+
+
+@lru_cache(maxsize=32)
+def _t_eval(time_horizon_days: int) -> np.ndarray:
+    """
+    Daily evaluation grid [0, 1, ..., T], cached per horizon
+
+    Scenario sweeps and the beam search rebuild the same few grids
+    hundreds of times; the arrays are read-only so callers cannot
+    mutate the cache.
+    """
+    t = np.arange(time_horizon_days + 1, dtype=np.float64)
+    t.flags.writeable = False
+    return t
+
 @dataclass
 class PyramidState:
     """
@@ -77,18 +105,19 @@ class PyramidState:
     velocity: Optional[np.ndarray] = None
     
     def to_vector(self) -> np.ndarray:
-        """Convert state to vector for ODE solving"""
-        return np.array([
-            self.foundation_mass,
-            self.middle_mass,
-            self.edge_mass,
-            self.tes,
-            self.vtr,
-            self.pai,
-            self.coherence,
-            self.agency,
-            self.drift
-        ] + list(self.lamague_vector))
+        """Convert state to a contiguous float64 vector for ODE solving"""
+        vec = np.empty(17, dtype=np.float64)
+        vec[0] = self.foundation_mass
+        vec[1] = self.middle_mass
+        vec[2] = self.edge_mass
+        vec[3] = self.tes
+        vec[4] = self.vtr
+        vec[5] = self.pai
+        vec[6] = self.coherence
+        vec[7] = self.agency
+        vec[8] = self.drift
+        vec[9:17] = self.lamague_vector
+        return vec
     
     @classmethod
     def from_vector(cls, vec: np.ndarray, timestamp: datetime) -> 'PyramidState':
@@ -104,20 +133,28 @@ class PyramidState:
             coherence=vec[6],
             agency=vec[7],
             drift=vec[8],
-            lamague_vector=vec[9:17]
+            lamague_vector=np.asarray(vec[9:17], dtype=np.float64)
         )
     
     def compute_total_truth_pressure(self) -> float:
-        """Weighted average truth pressure"""
-        return (
-            self.foundation_mass * 1.75 +  # Π ≈ 1.75
-            self.middle_mass * 1.35 +      # Π ≈ 1.35
-            self.edge_mass * 1.0           # Π ≈ 1.0
-        )
-    
+        """Weighted average truth pressure (cached after first call)"""
+        cached = self.__dict__.get('_truth_pressure')
+        if cached is None:
+            cached = (
+                self.foundation_mass * 1.75 +  # Π ≈ 1.75
+                self.middle_mass * 1.35 +      # Π ≈ 1.35
+                self.edge_mass * 1.0           # Π ≈ 1.0
+            )
+            self.__dict__['_truth_pressure'] = cached
+        return cached
+
     def compute_sovereignty_score(self) -> float:
-        """Overall sovereignty (must stay ≥ 0.7)"""
-        return (1 - self.drift) * self.agency * self.coherence
+        """Overall sovereignty (must stay ≥ 0.7; cached after first call)"""
+        cached = self.__dict__.get('_sovereignty')
+        if cached is None:
+            cached = (1 - self.drift) * self.agency * self.coherence
+            self.__dict__['_sovereignty'] = cached
+        return cached
     
     def is_stable(self) -> bool:
         """Check if pyramid is in healthy state"""
@@ -128,10 +165,157 @@ class PyramidState:
             abs(self.foundation_mass + self.middle_mass + self.edge_mass - 1.0) < 0.01
         )
 
+    @staticmethod
+    def is_stable_batch(buf: np.ndarray) -> np.ndarray:
+        """
+        Branchless stability check over a batch of state vectors
+
+        buf: (N, 17) matrix of to_vector() rows. Evaluates all four
+        stability conditions as vectorized compares combined with &,
+        so there is no per-state short-circuiting to mispredict.
+        Returns a boolean array of length N.
+        """
+        sovereignty = (1 - buf[:, 8]) * buf[:, 7] * buf[:, 6]
+        mass_sum = buf[:, 0] + buf[:, 1] + buf[:, 2]
+        return (
+            (sovereignty >= 0.7) &
+            (buf[:, 8] < 0.3) &
+            (buf[:, 6] > 0.6) &
+            (np.abs(mass_sum - 1.0) < 0.01)
+        )
+
+def _batch_derivatives(Y: np.ndarray,
+                       t: float,
+                       P: np.ndarray,
+                       learning_rate: float,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Vectorized dS/dt over a batch of trajectories
+
+    Y: (N, 17) state matrix, P: (N, 8) practice inputs.
+    Mirrors CascadeDynamics.compute_derivatives row-for-row, but computes
+    all N trajectories in one pass of NumPy kernels. Pass out to reuse a
+    derivative buffer across steps (every column is overwritten).
+    """
+    d = out if out is not None else np.empty_like(Y)
+
+    foundation, middle, edge = Y[:, 0], Y[:, 1], Y[:, 2]
+    tes, vtr, pai = Y[:, 3], Y[:, 4], Y[:, 5]
+    coherence, agency, drift = Y[:, 6], Y[:, 7], Y[:, 8]
+    lamague = Y[:, 9:17]
+
+    # Layer dynamics
+    evidence_pressure = tes * vtr
+    edge_to_middle_flow = learning_rate * edge * evidence_pressure
+    middle_to_foundation_flow = learning_rate * middle * evidence_pressure * 0.5
+    foundation_decay = 0.01 * foundation * (1 - evidence_pressure)
+    middle_decay = 0.02 * middle * (1 - evidence_pressure)
+
+    d[:, 0] = middle_to_foundation_flow - foundation_decay
+    d[:, 1] = edge_to_middle_flow - middle_to_foundation_flow - middle_decay
+    d[:, 2] = -edge_to_middle_flow + foundation_decay + middle_decay
+
+    total = d[:, 0] + d[:, 1] + d[:, 2]
+    d[:, 0:3] -= np.where(np.abs(total) > 1e-6, total / 3, 0.0)[:, None]
+
+    # AURA metrics
+    practice_effect = np.linalg.norm(P, axis=1) * learning_rate
+    d[:, 3] = practice_effect * (1 - tes) - 0.05 * tes
+    d[:, 4] = 0.1 * coherence * (1 - vtr) - 0.03 * vtr
+    d[:, 5] = 0.08 * agency * (1 - pai) - 0.02 * pai
+
+    # Sovereignty dynamics
+    d[:, 6] = 0.1 * (1 - drift) * (1 - coherence) - 0.05 * coherence
+    d[:, 7] = practice_effect * 0.5 - 0.02 * agency
+    d[:, 8] = -0.1 * drift + 0.05 * practice_effect
+
+    # LAMAGUE field
+    d[:, 9:17] = 0.2 * P * (1 - lamague) - 0.1 * lamague
+
+    np.clip(d, -1.0, 1.0, out=d)
+    return d
+
+
+def batch_integrate(states0: np.ndarray,
+                    practice_inputs: np.ndarray,
+                    n_steps: int,
+                    dt: float,
+                    learning_rate: float) -> np.ndarray:
+    """
+    Integrate N independent trajectories with fixed-step RK4 in one batch
+
+    states0: (N, 17), practice_inputs: (N, 8).
+    Returns an (N, n_steps + 1, 17) tensor of daily states. All N
+    trajectories advance together, so the per-step Python overhead is
+    amortized across the whole batch.
+    """
+    n = states0.shape[0]
+    out = np.empty((n, n_steps + 1, 17))
+    y = np.ascontiguousarray(states0, dtype=np.float64).copy()
+    out[:, 0] = y
+
+    # One set of stage/scratch buffers reused across all steps — the
+    # inner loop performs no allocations
+    k1, k2, k3, k4 = (np.empty_like(y) for _ in range(4))
+    ytmp = np.empty_like(y)
+
+    for step in range(n_steps):
+        t = step * dt
+        _batch_derivatives(y, t, practice_inputs, learning_rate, out=k1)
+
+        np.multiply(k1, dt / 2, out=ytmp)
+        ytmp += y
+        _batch_derivatives(ytmp, t + dt / 2, practice_inputs, learning_rate, out=k2)
+
+        np.multiply(k2, dt / 2, out=ytmp)
+        ytmp += y
+        _batch_derivatives(ytmp, t + dt / 2, practice_inputs, learning_rate, out=k3)
+
+        np.multiply(k3, dt, out=ytmp)
+        ytmp += y
+        _batch_derivatives(ytmp, t + dt, practice_inputs, learning_rate, out=k4)
+
+        # y += dt/6 * (k1 + 2*k2 + 2*k3 + k4), accumulated in place
+        k2 += k3
+        k2 *= 2
+        k1 += k2
+        k1 += k4
+        k1 *= dt / 6
+        y += k1
+
+        # Same constraints as the scalar path: clip, renormalize masses
+        np.clip(y, 0, 1, out=y)
+        mass_sum = y[:, 0:3].sum(axis=1)
+        np.divide(y[:, 0:3], np.maximum(mass_sum, 1e-12)[:, None], out=y[:, 0:3])
+
+        out[:, step + 1] = y
+
+    return out
+
+
+def rk4_integrate(y0: np.ndarray,
+                  t_span: Tuple[float, float],
+                  dt: float,
+                  practice_input: np.ndarray,
+                  learning_rate: float) -> np.ndarray:
+    """
+    Fixed-step RK4 integration of a single trajectory
+
+    For short, non-stiff horizons (states are clipped to [0, 1]) a
+    fixed-step RK4 avoids the adaptive-solver machinery and its
+    per-step marshalling entirely. Returns a (n_steps + 1, 17) array
+    of states sampled every dt.
+    """
+    t0, t1 = t_span
+    n_steps = max(1, int(round((t1 - t0) / dt)))
+    return batch_integrate(y0[None, :], practice_input[None, :],
+                           n_steps, dt, learning_rate)[0]
+
+
 class CascadeDynamics:
     """
     Differential equations governing pyramid evolution
-    
+
     This is the physics of knowledge transformation.
     """
     
@@ -147,7 +331,52 @@ class CascadeDynamics:
         self.learning_rate = learning_rate
         self.cascade_threshold = cascade_threshold
         self.drift_decay = drift_decay
-    
+
+        # Memoized trajectory segments keyed by quantized
+        # (initial state, practice input, horizon); LRU-evicted.
+        # The lock keeps lookups/evictions safe when scenarios run on a
+        # thread pool (simulate_scenario with n_jobs != 1)
+        self._traj_cache: OrderedDict = OrderedDict()
+        self._traj_cache_max = 10_000
+        self._traj_lock = threading.Lock()
+
+    @staticmethod
+    def _traj_key(y0: np.ndarray, practice_input: np.ndarray, n_steps: int) -> Tuple[int, int, int]:
+        """Quantize state/practice to 0.01 so near-identical scenarios share entries"""
+        return (
+            hash(np.round(y0 * 100).astype(np.int8).tobytes()),
+            hash(np.round(practice_input * 100).astype(np.int8).tobytes()),
+            n_steps
+        )
+
+    def integrate_cached(self,
+                         y0: np.ndarray,
+                         practice_input: np.ndarray,
+                         n_steps: int,
+                         dt: float = 1.0) -> np.ndarray:
+        """
+        RK4 integration with persistent trajectory memoization
+
+        Scenario exploration repeatedly simulates the same
+        (state, practice schedule) pairs; cached segments make repeated
+        sub-simulations free. Returned arrays are shared — copy before
+        mutating.
+        """
+        key = self._traj_key(y0, practice_input, n_steps)
+        with self._traj_lock:
+            cached = self._traj_cache.get(key)
+            if cached is not None:
+                self._traj_cache.move_to_end(key)
+                return cached
+
+        traj = rk4_integrate(y0, (0.0, n_steps * dt), dt, practice_input, self.learning_rate)
+        with self._traj_lock:
+            if len(self._traj_cache) >= self._traj_cache_max:
+                self._traj_cache.popitem(last=False)
+            self._traj_cache[key] = traj
+        return traj
+
+
     def compute_derivatives(self, 
                           state_vec: np.ndarray, 
                           t: float,
@@ -174,7 +403,7 @@ class CascadeDynamics:
         
         # Practice input (default: no practice)
         if practice_input is None:
-            practice_input = np.zeros(8)
+            practice_input = _ZERO_PRACTICE
         
         # LAYER DYNAMICS (knowledge flow)
         # Evidence accumulation pushes practices upward
@@ -221,81 +450,101 @@ class CascadeDynamics:
         d_state[8] = natural_decay + practice_noise  # dDrift/dt
         
         # LAMAGUE FIELD DYNAMICS
-        # Each dimension evolves based on practice input
-        for i in range(8):
-            if i < len(practice_input):
-                d_state[9 + i] = 0.2 * practice_input[i] * (1 - lamague[i]) - 0.1 * lamague[i]
-            else:
-                d_state[9 + i] = -0.1 * lamague[i]
+        # Each dimension evolves based on practice input. The common case is
+        # a full 8-dimensional practice vector, which gets a straight-line
+        # vectorized path with no per-element bounds check; shorter inputs
+        # fall back to the padded general form.
+        if len(practice_input) == 8:
+            d_state[9:17] = 0.2 * practice_input * (1 - lamague) - 0.1 * lamague
+        else:
+            k = min(8, len(practice_input))
+            d_state[9:9 + k] = 0.2 * practice_input[:k] * (1 - lamague[:k]) - 0.1 * lamague[:k]
+            d_state[9 + k:17] = -0.1 * lamague[k:]
         
         # Clip derivatives to prevent instability
         d_state = np.clip(d_state, -1.0, 1.0)
         
         return d_state
     
+    def compute_derivatives_batch(self,
+                                  Y: np.ndarray,
+                                  t: float,
+                                  P: np.ndarray,
+                                  out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Vectorized dS/dt over an (N, 17) batch with (N, 8) practice inputs"""
+        return _batch_derivatives(Y, t, P, self.learning_rate, out=out)
+
+    def simulate_batch(self,
+                       states: np.ndarray,
+                       inputs: np.ndarray,
+                       n_steps: int,
+                       dt: float = 1.0) -> np.ndarray:
+        """
+        Simulate N independent trajectories at once
+
+        states: (N, 17) initial state matrix (rows from PyramidState.to_vector),
+        inputs: (N, 8) constant practice inputs. Returns (N, n_steps + 1, 17).
+        Embarrassingly parallel across trajectories; one batched call replaces
+        N Python-level integration loops.
+        """
+        return batch_integrate(states, inputs, n_steps, dt, self.learning_rate)
+
+    def cascade_margin(self, state_vec: np.ndarray) -> float:
+        """
+        Signed distance to the cascade trigger on a raw 17-vector
+
+        Positive while stable, crosses zero exactly when a cascade fires,
+        so it doubles as the terminal event function for solve_ivp.
+        """
+        upward_pressure = state_vec[2] * state_vec[3] * state_vec[4]
+        downward_pressure = state_vec[0] * (1 - state_vec[3]) * (1 - state_vec[4])
+        return self.cascade_threshold - max(upward_pressure, downward_pressure)
+
+    def detect_cascade_trigger_vec(self, state_vec: np.ndarray) -> bool:
+        """Cascade check on a raw 17-vector (no dataclass round-trip)"""
+        return self.cascade_margin(state_vec) < 0
+
     def detect_cascade_trigger(self, state: PyramidState) -> bool:
         """
         Is a cascade about to happen?
-        
+
         Cascade triggers when:
         1. Large mass in edge layer with high evidence
         2. Large mass in foundation with low evidence
         """
-        # High evidence edge practices ready to cascade up
-        upward_pressure = state.edge_mass * state.tes * state.vtr
-        
-        # Low evidence foundation practices ready to cascade down
-        downward_pressure = state.foundation_mass * (1 - state.tes) * (1 - state.vtr)
-        
-        return (upward_pressure > self.cascade_threshold or 
-                downward_pressure > self.cascade_threshold)
-    
-    def simulate_cascade(self, state: PyramidState) -> PyramidState:
+        return self.detect_cascade_trigger_vec(state.to_vector())
+
+    def apply_cascade(self, state_vec: np.ndarray) -> None:
         """
-        Execute a cascade reorganization
-        
-        This is a discontinuous jump in the phase space.
+        Execute a cascade reorganization in place on a 17-vector
+
+        Mass redistribution and renormalization are fused into one
+        vector operation on the [foundation, middle, edge] triple.
         """
-        new_state = PyramidState(
-            timestamp=state.timestamp,
-            foundation_mass=state.foundation_mass,
-            middle_mass=state.middle_mass,
-            edge_mass=state.edge_mass,
-            tes=state.tes,
-            vtr=state.vtr,
-            pai=state.pai,
-            coherence=state.coherence,
-            agency=state.agency,
-            drift=state.drift,
-            lamague_vector=state.lamague_vector.copy()
-        )
-        
         # Redistribute mass based on evidence
-        evidence = state.tes * state.vtr
-        
+        evidence = state_vec[3] * state_vec[4]
+
         if evidence > 0.7:
             # Upward cascade: Edge → Middle → Foundation
-            flow = state.edge_mass * 0.3
-            new_state.edge_mass -= flow
-            new_state.middle_mass += flow * 0.7
-            new_state.foundation_mass += flow * 0.3
+            mass = state_vec[:3] + state_vec[2] * 0.3 * _MASS_UP
         else:
             # Downward cascade: Foundation → Middle → Edge
-            flow = state.foundation_mass * 0.2
-            new_state.foundation_mass -= flow
-            new_state.middle_mass += flow * 0.6
-            new_state.edge_mass += flow * 0.4
-        
-        # Normalize
-        total = new_state.foundation_mass + new_state.middle_mass + new_state.edge_mass
-        new_state.foundation_mass /= total
-        new_state.middle_mass /= total
-        new_state.edge_mass /= total
-        
+            mass = state_vec[:3] + state_vec[0] * 0.2 * _MASS_DN
+
+        state_vec[:3] = mass / mass.sum()
+
         # Coherence temporarily drops during cascade
-        new_state.coherence *= 0.8
-        
-        return new_state
+        state_vec[6] *= 0.8
+
+    def simulate_cascade(self, state: PyramidState) -> PyramidState:
+        """
+        Execute a cascade reorganization
+
+        This is a discontinuous jump in the phase space.
+        """
+        vec = state.to_vector()
+        self.apply_cascade(vec)
+        return PyramidState.from_vector(vec, state.timestamp)
 
 # =========================
 # TRAJECTORY PREDICTION
@@ -319,60 +568,108 @@ class TrajectoryPrediction:
     """
     initial_state: PyramidState
     time_horizon_days: int
-    
-    # Predicted states (one per day)
-    predicted_states: List[PyramidState] = field(default_factory=list)
-    
+
+    # Predicted states as a struct-of-arrays: (T+1, 17) matrix whose rows
+    # follow the PyramidState.to_vector layout. PyramidState objects are
+    # only materialized lazily through the predicted_states view.
+    predicted_arr: np.ndarray = field(default_factory=lambda: np.zeros((0, 17)))
+
     # Predicted cascade events
     cascade_days: List[int] = field(default_factory=list)
-    
+
     # Confidence intervals (Bayesian)
     uncertainty: np.ndarray = field(default_factory=lambda: np.zeros(17))
-    
+
+    # Lazy dataclass views over predicted_arr
+    _states_cache: Optional[List[PyramidState]] = field(default=None, init=False, repr=False)
+    _sovereignty_cache: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _truth_pressure_cache: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    @property
+    def sovereignty(self) -> np.ndarray:
+        """Per-day sovereignty score column, computed once"""
+        if self._sovereignty_cache is None or len(self._sovereignty_cache) != len(self.predicted_arr):
+            arr = self.predicted_arr
+            self._sovereignty_cache = (1 - arr[:, 8]) * arr[:, 7] * arr[:, 6]
+        return self._sovereignty_cache
+
+    @property
+    def truth_pressure(self) -> np.ndarray:
+        """Per-day truth pressure column, computed once"""
+        if self._truth_pressure_cache is None or len(self._truth_pressure_cache) != len(self.predicted_arr):
+            arr = self.predicted_arr
+            self._truth_pressure_cache = (
+                arr[:, 0] * 1.75 + arr[:, 1] * 1.35 + arr[:, 2] * 1.0)
+        return self._truth_pressure_cache
+
+    @property
+    def predicted_states(self) -> List[PyramidState]:
+        """Per-day PyramidState views, built lazily from predicted_arr"""
+        if self._states_cache is None or len(self._states_cache) != len(self.predicted_arr):
+            self._states_cache = [
+                self._state_at(day) for day in range(len(self.predicted_arr))
+            ]
+        return self._states_cache
+
+    def _state_at(self, day: int) -> PyramidState:
+        return PyramidState.from_vector(
+            self.predicted_arr[day],
+            self.initial_state.timestamp + timedelta(days=day))
+
     def get_final_state(self) -> PyramidState:
         """State at end of prediction"""
-        return self.predicted_states[-1] if self.predicted_states else self.initial_state
-    
+        if len(self.predicted_arr) == 0:
+            return self.initial_state
+        return self._state_at(len(self.predicted_arr) - 1)
+
     def get_state_at_day(self, day: int) -> Optional[PyramidState]:
         """Get predicted state at specific day"""
-        if 0 <= day < len(self.predicted_states):
-            return self.predicted_states[day]
+        if 0 <= day < len(self.predicted_arr):
+            return self._state_at(day)
         return None
-    
+
     def compute_improvement_score(self) -> float:
         """Overall improvement from initial to final"""
-        initial = self.initial_state
-        final = self.get_final_state()
-        
+        initial = self.initial_state.to_vector()
+        final = self.predicted_arr[-1] if len(self.predicted_arr) else initial
+
         # Weighted sum of improvements
         improvements = [
-            (final.coherence - initial.coherence) * 2.0,
-            (final.agency - initial.agency) * 1.5,
-            (initial.drift - final.drift) * 2.0,  # Lower drift is better
-            (final.tes - initial.tes) * 1.0,
-            (final.vtr - initial.vtr) * 1.0,
-            (final.pai - initial.pai) * 0.5,
+            (final[6] - initial[6]) * 2.0,   # coherence
+            (final[7] - initial[7]) * 1.5,   # agency
+            (initial[8] - final[8]) * 2.0,   # lower drift is better
+            (final[3] - initial[3]) * 1.0,   # tes
+            (final[4] - initial[4]) * 1.0,   # vtr
+            (final[5] - initial[5]) * 0.5,   # pai
         ]
-        
+
         return sum(improvements) / len(improvements)
-    
+
     def detect_warning_signs(self) -> List[Tuple[int, str]]:
         """Early warning system for problems"""
         warnings = []
-        
-        for day, state in enumerate(self.predicted_states):
-            # Sovereignty dropping
-            if state.compute_sovereignty_score() < 0.7:
-                warnings.append((day, f"Sovereignty below threshold: {state.compute_sovereignty_score():.2f}"))
-            
-            # Excessive drift
-            if state.drift > 0.4:
-                warnings.append((day, f"Drift exceeding safe limit: {state.drift:.2f}"))
-            
-            # Coherence collapse
-            if state.coherence < 0.5:
-                warnings.append((day, f"Coherence critically low: {state.coherence:.2f}"))
-        
+
+        arr = self.predicted_arr
+        if len(arr) == 0:
+            return warnings
+
+        sovereignty = self.sovereignty
+        drift = arr[:, 8]
+        coherence = arr[:, 6]
+
+        # One vectorized pass finds the problem days; messages are only
+        # formatted for those
+        problem_days = np.flatnonzero(
+            (sovereignty < 0.7) | (drift > 0.4) | (coherence < 0.5))
+
+        for day in problem_days:
+            if sovereignty[day] < 0.7:
+                warnings.append((day, f"Sovereignty below threshold: {sovereignty[day]:.2f}"))
+            if drift[day] > 0.4:
+                warnings.append((day, f"Drift exceeding safe limit: {drift[day]:.2f}"))
+            if coherence[day] < 0.5:
+                warnings.append((day, f"Coherence critically low: {coherence[day]:.2f}"))
+
         return warnings
 
 class TemporalOracle:
@@ -382,15 +679,31 @@ class TemporalOracle:
     This is the future-sight of CASCADE.
     """
     
+    # Metric order matches the PyramidState.to_vector layout
+    METRIC_NAMES = (
+        'foundation', 'middle', 'edge',
+        'tes', 'vtr', 'pai',
+        'coherence', 'agency', 'drift'
+    ) + tuple(f'lamague_{i}' for i in range(8))
+
     def __init__(self):
         self.dynamics = CascadeDynamics()
-        
+
         # Historical data for Bayesian updating
         self.prediction_history: List[Tuple[TrajectoryPrediction, List[PyramidState]]] = []
-        
-        # Learned error model
-        self.error_model: Dict[str, float] = defaultdict(lambda: 0.1)
-    
+
+        # Learned error model: one float per metric, in METRIC_NAMES order
+        self.error_vec = np.full(17, 0.1)
+
+        # Memoized predictions keyed by (quantized state, practice, horizon);
+        # greedy/beam search revisits the same decision points repeatedly.
+        # Guarded by a lock because simulate_scenario may call
+        # predict_trajectory from a thread pool
+        self._predict_cache: Dict[Tuple[bytes, str, int], TrajectoryPrediction] = {}
+        self._predict_cache_max = 2048
+        self._cache_lock = threading.Lock()
+
+
     def predict_trajectory(self,
                           initial_state: PyramidState,
                           practice_protocol: Optional[PracticeProtocol],
@@ -402,180 +715,367 @@ class TemporalOracle:
         """
         # Convert to vectors for ODE solving
         y0 = initial_state.to_vector()
-        t = np.linspace(0, time_horizon_days, time_horizon_days + 1)
+
+        # State rounded to 3 decimals exploits repeated decision points
+        cache_key = (np.round(y0, 3).tobytes(),
+                     practice_protocol.name if practice_protocol else "",
+                     time_horizon_days)
+        with self._cache_lock:
+            cached = self._predict_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        t = _t_eval(time_horizon_days)
         
-        # Define practice input function
+        # Pre-discretize the practice input into a (T+1, 8) schedule so the
+        # RHS indexes a row per evaluation instead of rebuilding the scaled
+        # signature (or a fresh zero vector) every call. With no protocol
+        # every day shares the read-only zero sentinel (zero-copy view).
         if practice_protocol:
-            def practice_input(day):
-                if day <= practice_protocol.duration_days:
-                    return practice_protocol.lamague_signature * practice_protocol.intensity
-                else:
-                    return np.zeros(8)
+            P = np.zeros((time_horizon_days + 1, 8))
+            end = min(practice_protocol.duration_days, time_horizon_days)
+            P[:end + 1] = practice_protocol.lamague_signature * practice_protocol.intensity
         else:
-            def practice_input(day):
-                return np.zeros(8)
+            P = np.broadcast_to(_ZERO_PRACTICE, (time_horizon_days + 1, 8))
         
-        # Solve ODEs with practice input
-        predicted_states = []
+        # Solve ODEs with practice input. LSODA amortizes Python overhead
+        # across the compiled integrator and takes multi-day steps where
+        # the dynamics are smooth; cascades are caught exactly via a
+        # terminal event, applied as a jump, then integration restarts
+        # (branching simulation).
+        def rhs(t, y):
+            return self.dynamics.compute_derivatives(
+                y, t, P[min(int(t), time_horizon_days)])
+
+        margin = self.dynamics.cascade_margin
+
+        def cascade_event(t, y):
+            # Crosses zero downward exactly when detect_cascade_trigger
+            # would fire
+            return margin(y)
+
+        cascade_event.terminal = True
+        cascade_event.direction = -1
+
+        states_arr = np.empty((time_horizon_days + 1, 17))
+        states_arr[0] = y0
         cascade_days = []
+
         current_vec = y0.copy()
-        
-        for day in range(time_horizon_days + 1):
-            # Current state
-            state = PyramidState.from_vector(current_vec, 
-                                            initial_state.timestamp + timedelta(days=day))
-            predicted_states.append(state)
-            
-            # Check for cascade
-            if self.dynamics.detect_cascade_trigger(state):
-                cascade_days.append(day)
-                state = self.dynamics.simulate_cascade(state)
-                current_vec = state.to_vector()
-            
-            # Evolve forward one day
-            if day < time_horizon_days:
-                p_input = practice_input(day)
-                derivatives = self.dynamics.compute_derivatives(current_vec, day, p_input)
-                current_vec = current_vec + derivatives
-                
-                # Ensure constraints
-                current_vec = np.clip(current_vec, 0, 1)
-                
-                # Normalize layer masses
-                mass_sum = current_vec[0] + current_vec[1] + current_vec[2]
-                if mass_sum > 0:
-                    current_vec[0:3] /= mass_sum
+        t0 = 0.0
+        filled_through = 0
+        while t0 < time_horizon_days:
+            segment_eval = t[t > t0]
+            if segment_eval.size == 0:
+                break
+            sol = solve_ivp(rhs, (t0, time_horizon_days), current_vec,
+                            method='LSODA', t_eval=segment_eval,
+                            events=cascade_event)
+
+            for k, tk in enumerate(sol.t):
+                states_arr[int(round(tk))] = sol.y[:, k]
+            if sol.t.size > 0:
+                filled_through = int(round(sol.t[-1]))
+
+            if sol.status == 1 and len(sol.t_events[0]) > 0:
+                te = float(sol.t_events[0][0])
+                if te <= t0 + 1e-9:
+                    break
+                cascade_days.append(min(int(math.ceil(te)), time_horizon_days))
+                current_vec = sol.y_events[0][0].copy()
+                self.dynamics.apply_cascade(current_vec)
+                t0 = te
+            else:
+                break
+
+        # A solver failure or an immediately re-triggering cascade ends
+        # integration early; hold the last computed state over the
+        # remaining days instead of returning uninitialized rows
+        if filled_through < time_horizon_days:
+            states_arr[filled_through + 1:] = states_arr[filled_through]
+
+        # Apply constraints at the sampled days only (LSODA handles the
+        # interior), then rebuild the daily states
+        np.clip(states_arr, 0, 1, out=states_arr)
+        mass_sum = states_arr[:, 0:3].sum(axis=1)
+        states_arr[:, 0:3] /= np.maximum(mass_sum, 1e-12)[:, None]
         
         # Compute uncertainty (increases with time)
-        uncertainty = np.ones(17) * 0.05  # Base uncertainty
-        for i, error in enumerate(self.error_model.values()):
-            if i < 17:
-                uncertainty[i] += error * np.sqrt(time_horizon_days / 30)  # Grows with sqrt(time)
-        
+        uncertainty = self._compute_uncertainty(time_horizon_days)
+
         prediction = TrajectoryPrediction(
             initial_state=initial_state,
             time_horizon_days=time_horizon_days,
-            predicted_states=predicted_states,
+            predicted_arr=states_arr,
             cascade_days=cascade_days,
             uncertainty=uncertainty
         )
-        
+
+        with self._cache_lock:
+            if len(self._predict_cache) >= self._predict_cache_max:
+                self._predict_cache.pop(next(iter(self._predict_cache)), None)
+            self._predict_cache[cache_key] = prediction
+
         return prediction
-    
+
+    @property
+    def error_model(self) -> Dict[str, float]:
+        """Named view of the learned per-metric errors (for reporting)"""
+        return dict(zip(self.METRIC_NAMES, self.error_vec))
+
+    def _compute_uncertainty(self, time_horizon_days: int) -> np.ndarray:
+        """Per-metric uncertainty, growing with sqrt(horizon)"""
+        return 0.05 + self.error_vec * np.sqrt(time_horizon_days / 30)
+
+    def predict_trajectory_batch(self,
+                                 initial_state: PyramidState,
+                                 protocols: List[Optional[PracticeProtocol]],
+                                 time_horizon_days: int) -> List[TrajectoryPrediction]:
+        """
+        Predict N candidate trajectories as one stacked solve_ivp batch
+
+        All candidates integrate together as a single 17N-dimensional
+        system under the same LSODA + terminal-cascade-event scheme as
+        predict_trajectory, so the batch evolves the exact dynamics the
+        scalar oracle reports while the solver amortizes its stepping
+        over one vectorized RHS. This is the workhorse behind the beam
+        practice search. initial_state may be a single PyramidState
+        shared by every row, or an (N, 17) array of per-row starting
+        points (as the beam search needs).
+        """
+        n = len(protocols)
+        T = time_horizon_days
+
+        if isinstance(initial_state, np.ndarray):
+            Y0 = np.array(initial_state, dtype=np.float64)
+            now = datetime.now()
+            initial_states = [PyramidState.from_vector(row.copy(), now)
+                              for row in Y0]
+        else:
+            Y0 = np.tile(initial_state.to_vector(), (n, 1))
+            initial_states = [initial_state] * n
+
+        # Pre-discretized practice schedules: (N, T+1, 8)
+        P = np.zeros((n, T + 1, 8))
+        for i, protocol in enumerate(protocols):
+            if protocol is not None:
+                end = min(protocol.duration_days, T)
+                P[i, :end + 1] = protocol.lamague_signature * protocol.intensity
+
+        def rhs(t, y):
+            day = min(int(t), T)
+            return self.dynamics.compute_derivatives_batch(
+                y.reshape(n, 17), t, P[:, day]).ravel()
+
+        # One terminal event per row, mirroring the scalar path: the
+        # solver stops exactly at a cascade crossing, the jump is applied
+        # to the triggered rows, and integration restarts
+        margin = self.dynamics.cascade_margin
+
+        def make_event(row):
+            def cascade_event(t, y):
+                return margin(y[row * 17:(row + 1) * 17])
+            cascade_event.terminal = True
+            cascade_event.direction = -1
+            return cascade_event
+
+        events = [make_event(row) for row in range(n)]
+
+        t = _t_eval(T)
+        states = np.empty((n, T + 1, 17))
+        states[:, 0] = Y0
+        cascade_days: List[List[int]] = [[] for _ in range(n)]
+
+        current = Y0.ravel().copy()
+        t0 = 0.0
+        filled_through = 0
+        while t0 < T:
+            segment_eval = t[t > t0]
+            if segment_eval.size == 0:
+                break
+            sol = solve_ivp(rhs, (t0, T), current, method='LSODA',
+                            t_eval=segment_eval, events=events)
+
+            for k, tk in enumerate(sol.t):
+                states[:, int(round(tk))] = sol.y[:, k].reshape(n, 17)
+            if sol.t.size > 0:
+                filled_through = int(round(sol.t[-1]))
+
+            if sol.status == 1:
+                te = min(float(ev[0]) for ev in sol.t_events if len(ev) > 0)
+                if te <= t0 + 1e-9:
+                    break
+                fired = [row for row, ev in enumerate(sol.t_events)
+                         if len(ev) > 0 and float(ev[0]) <= te + 1e-9]
+                current = sol.y_events[fired[0]][0].copy()
+                Y = current.reshape(n, 17)
+                day_mark = min(int(math.ceil(te)), T)
+                for row in fired:
+                    cascade_days[row].append(day_mark)
+                    self.dynamics.apply_cascade(Y[row])
+                t0 = te
+            else:
+                break
+
+        # Same early-termination guard as the scalar path
+        if filled_through < T:
+            states[:, filled_through + 1:] = states[:, filled_through:filled_through + 1]
+
+        # Constraints at the sampled days only, as in predict_trajectory
+        np.clip(states, 0, 1, out=states)
+        mass_sum = states[:, :, 0:3].sum(axis=2)
+        states[:, :, 0:3] /= np.maximum(mass_sum, 1e-12)[:, :, None]
+
+        uncertainty = self._compute_uncertainty(T)
+
+        return [
+            TrajectoryPrediction(
+                initial_state=initial_states[i],
+                time_horizon_days=T,
+                predicted_arr=states[i],
+                cascade_days=cascade_days[i],
+                uncertainty=uncertainty
+            )
+            for i in range(n)
+        ]
+
     def simulate_scenario(self,
                          initial_state: PyramidState,
-                         scenarios: List[Tuple[str, PracticeProtocol]]) -> Dict[str, TrajectoryPrediction]:
+                         scenarios: List[Tuple[str, PracticeProtocol]],
+                         n_jobs: int = 1) -> Dict[str, TrajectoryPrediction]:
         """
         Run multiple "what-if" scenarios
-        
+
         Example: "What if I do meditation vs shadow work vs both?"
+
+        Every scenario goes through predict_trajectory, so the answers
+        are identical regardless of n_jobs. With n_jobs != 1 the
+        scenarios run on a thread pool (scenario evaluation is
+        embarrassingly parallel, and the solver work releases the GIL).
         """
-        results = {}
-        
-        for name, protocol in scenarios:
-            prediction = self.predict_trajectory(
-                initial_state,
-                protocol,
-                protocol.duration_days if protocol else 90
-            )
-            results[name] = prediction
-        
-        return results
+        protocols = [protocol for _, protocol in scenarios]
+        horizons = [p.duration_days if p else 90 for p in protocols]
+
+        if n_jobs != 1:
+            workers = None if n_jobs < 0 else n_jobs
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self.predict_trajectory, initial_state, protocol, horizon)
+                    for protocol, horizon in zip(protocols, horizons)
+                ]
+                return {name: f.result()
+                        for (name, _), f in zip(scenarios, futures)}
+
+        return {
+            name: self.predict_trajectory(initial_state, protocol, horizon)
+            for (name, protocol), horizon in zip(scenarios, horizons)
+        }
     
     def optimize_practice_sequence(self,
                                   initial_state: PyramidState,
                                   available_practices: List[PracticeProtocol],
                                   target_metrics: Dict[str, float],
-                                  max_time_days: int) -> List[PracticeProtocol]:
+                                  max_time_days: int,
+                                  beam_width: int = 3) -> List[PracticeProtocol]:
         """
         Find optimal sequence of practices to reach target
-        
-        This is the AI coach: "Do shadow work weeks 1-4, then meditation weeks 5-8"
+
+        This is the AI coach: "Do shadow work weeks 1-4, then meditation
+        weeks 5-8". A small-beam search keeps the beam_width best partial
+        sequences alive instead of committing greedily to one, which
+        avoids the local optima greedy gets stuck in while costing only
+        beam_width times a greedy step — every (frontier, practice) pair
+        is rolled out together in one vectorized batch.
         """
-        # Simple greedy optimization (could be improved with RL)
-        sequence = []
-        current_state = initial_state
-        remaining_days = max_time_days
-        
-        while remaining_days > 0:
-            best_practice = None
-            best_score = -float('inf')
-            
-            # Try each practice
-            for practice in available_practices:
-                if practice.duration_days > remaining_days:
+        # Fold the target-metric dict into index/target/sign arrays once;
+        # scoring then becomes one vectorized reduction per search step
+        scored = [(col, target, -1.0 if metric == "drift" else 1.0)
+                  for metric, target in target_metrics.items()
+                  for col in ({"coherence": 6, "agency": 7, "drift": 8}.get(metric),)
+                  if col is not None]
+        metric_cols = np.array([c for c, _, _ in scored], dtype=int)
+        target_vec = np.array([t for _, t, _ in scored])
+        sign_vec = np.array([s for _, _, s in scored])
+
+        # Frontier entries: (score, sequence, state vector, remaining days)
+        frontier = [(-np.inf, [], initial_state.to_vector().copy(), max_time_days)]
+        completed: List[Tuple[float, List[PracticeProtocol]]] = []
+
+        while frontier:
+            # Expand every frontier entry with every feasible practice
+            expansions: List[Tuple[int, PracticeProtocol]] = []
+            for fi, (score, sequence, state_vec, remaining) in enumerate(frontier):
+                candidates = [p for p in available_practices
+                              if 0 < p.duration_days <= remaining]
+                if not candidates:
+                    completed.append((score, sequence))
                     continue
-                
-                # Predict outcome
-                prediction = self.predict_trajectory(
-                    current_state,
-                    practice,
-                    practice.duration_days
-                )
-                
-                # Score based on target metrics
-                final_state = prediction.get_final_state()
-                score = 0
-                for metric, target in target_metrics.items():
-                    if metric == "coherence":
-                        score += (final_state.coherence - target) ** 2
-                    elif metric == "agency":
-                        score += (final_state.agency - target) ** 2
-                    elif metric == "drift":
-                        score -= (final_state.drift - target) ** 2  # Lower is better
-                
-                if score > best_score:
-                    best_score = score
-                    best_practice = practice
-            
-            if best_practice is None:
+                expansions.extend((fi, p) for p in candidates)
+
+            if not expansions:
                 break
-            
-            sequence.append(best_practice)
-            
-            # Update state
-            prediction = self.predict_trajectory(
-                current_state,
-                best_practice,
-                best_practice.duration_days
-            )
-            current_state = prediction.get_final_state()
-            remaining_days -= best_practice.duration_days
-        
-        return sequence
+
+            # One batched rollout covers all (frontier, practice) pairs
+            starts = np.array([frontier[fi][2] for fi, _ in expansions])
+            practices = [p for _, p in expansions]
+            max_duration = max(p.duration_days for p in practices)
+            predictions = self.predict_trajectory_batch(
+                starts, practices, max_duration)
+
+            # Each pair's final state at its own horizon, scored in one
+            # vectorized reduction over the (N, 17) finals matrix
+            finals = np.stack([
+                prediction.predicted_arr[practice.duration_days]
+                for practice, prediction in zip(practices, predictions)
+            ])
+            if metric_cols.size:
+                scores = ((finals[:, metric_cols] - target_vec) ** 2 * sign_vec).sum(axis=1)
+            else:
+                scores = np.zeros(len(expansions))
+
+            # Keep the beam_width best expansions as the next frontier
+            order = np.argsort(scores)[::-1][:beam_width]
+            frontier = [
+                (float(scores[k]),
+                 frontier[expansions[k][0]][1] + [expansions[k][1]],
+                 finals[k].copy(),
+                 frontier[expansions[k][0]][3] - expansions[k][1].duration_days)
+                for k in order
+            ]
+
+        completed.extend((score, sequence) for score, sequence, _, _ in frontier)
+        if not completed:
+            return []
+        return max(completed, key=lambda entry: entry[0])[1]
     
     def update_from_reality(self,
                            prediction: TrajectoryPrediction,
-                           actual_states: List[PyramidState]):
+                           actual_states):
         """
         Bayesian update: Learn from prediction errors
-        
-        This makes the oracle wiser over time.
+
+        This makes the oracle wiser over time. actual_states may be a
+        List[PyramidState] or an already-stacked (T, 17) array; either way
+        the errors are one vectorized subtract against predicted_arr
+        instead of per-day to_vector round-trips.
         """
         # Store for history
         self.prediction_history.append((prediction, actual_states))
-        
-        # Compute errors
-        errors = []
-        for i, (pred, actual) in enumerate(zip(prediction.predicted_states, actual_states)):
-            pred_vec = pred.to_vector()
-            actual_vec = actual.to_vector()
-            error = np.abs(pred_vec - actual_vec)
-            errors.append(error)
-        
-        # Update error model (exponential moving average)
-        if errors:
-            mean_error = np.mean(errors, axis=0)
-            alpha = 0.3  # Learning rate
-            
-            metric_names = [
-                'foundation', 'middle', 'edge',
-                'tes', 'vtr', 'pai',
-                'coherence', 'agency', 'drift'
-            ] + [f'lamague_{i}' for i in range(8)]
-            
-            for i, (metric, error) in enumerate(zip(metric_names, mean_error)):
-                self.error_model[metric] = (1 - alpha) * self.error_model[metric] + alpha * error
+
+        if isinstance(actual_states, np.ndarray):
+            actuals_arr = actual_states
+        else:
+            actuals_arr = np.array([s.to_vector() for s in actual_states])
+
+        if actuals_arr.shape[0] == 0:
+            return
+
+        n = min(actuals_arr.shape[0], prediction.predicted_arr.shape[0])
+        errors = np.abs(prediction.predicted_arr[:n] - actuals_arr[:n])
+
+        # Update error model (exponential moving average, one vector op)
+        mean_error = errors.mean(axis=0)
+        alpha = 0.3  # Learning rate
+        self.error_vec = (1 - alpha) * self.error_vec + alpha * mean_error
 
 # =========================
 # TEMPORAL ANCHORS
@@ -618,56 +1118,56 @@ class TemporalAnchorSystem:
     This bridges prediction to validation.
     """
     
+    # (metric name, column index in the to_vector layout)
+    ANCHOR_METRICS = (('coherence', 6), ('agency', 7), ('drift', 8), ('tes', 3))
+
     def __init__(self):
         self.anchors: List[TemporalAnchor] = []
-    
-    def generate_anchors(self, 
+        # (day, metric_name) -> anchor, so validation is O(1) instead of
+        # a linear scan over every anchor ever generated
+        self._index: Dict[Tuple[int, str], TemporalAnchor] = {}
+
+    def generate_anchors(self,
                         prediction: TrajectoryPrediction,
                         check_days: List[int]) -> List[TemporalAnchor]:
         """
         Create validation checkpoints from prediction
-        
+
         Example: Check at days 7, 14, 30, 60
         """
+        days = np.array([d for d in check_days
+                         if d < len(prediction.predicted_arr)], dtype=int)
+        if days.size == 0:
+            return []
+
+        # Slice all (day, metric) values and confidence bounds in one shot
+        metric_cols = np.array([col for _, col in self.ANCHOR_METRICS])
+        values = prediction.predicted_arr[days][:, metric_cols]   # (D, M)
+        stds = prediction.uncertainty[metric_cols]                # (M,)
+        lowers = values - 1.96 * stds  # 95% confidence interval
+        uppers = values + 1.96 * stds
+
         anchors = []
-        
-        for day in check_days:
-            if day >= len(prediction.predicted_states):
-                continue
-            
-            state = prediction.predicted_states[day]
-            uncertainty = prediction.uncertainty
-            
-            # Create anchors for key metrics
-            metrics = [
-                ('coherence', state.coherence, uncertainty[6]),
-                ('agency', state.agency, uncertainty[7]),
-                ('drift', state.drift, uncertainty[8]),
-                ('tes', state.tes, uncertainty[3])
-            ]
-            
-            for metric_name, value, std in metrics:
-                # 95% confidence interval
-                lower = value - 1.96 * std
-                upper = value + 1.96 * std
-                
+        for i, day in enumerate(days):
+            for j, (metric_name, _) in enumerate(self.ANCHOR_METRICS):
                 anchor = TemporalAnchor(
-                    day=day,
+                    day=int(day),
                     metric_name=metric_name,
-                    predicted_value=value,
-                    confidence_interval=(lower, upper)
+                    predicted_value=float(values[i, j]),
+                    confidence_interval=(float(lowers[i, j]), float(uppers[i, j]))
                 )
                 anchors.append(anchor)
-        
+                self._index[(int(day), metric_name)] = anchor
+
         self.anchors.extend(anchors)
         return anchors
-    
+
     def validate_anchor(self, day: int, metric_name: str, actual_value: float):
         """Reality arrives - check if we were right"""
-        for anchor in self.anchors:
-            if anchor.day == day and anchor.metric_name == metric_name:
-                anchor.actual_value = actual_value
-                anchor.validated = anchor.check_validation()
+        anchor = self._index.get((day, metric_name))
+        if anchor is not None:
+            anchor.actual_value = actual_value
+            anchor.validated = anchor.check_validation()
     
     def compute_overall_accuracy(self) -> float:
         """How accurate have predictions been?"""
@@ -692,21 +1192,30 @@ class TrajectoryVisualizer:
         
         initial = prediction.initial_state
         final = prediction.get_final_state()
-        
-        report = f"""
+
+        # Each derived metric is computed exactly once, and the report is
+        # assembled with a list join instead of repeated string concatenation
+        init_sov = initial.compute_sovereignty_score()
+        final_sov = final.compute_sovereignty_score()
+        init_tp = initial.compute_total_truth_pressure()
+        final_tp = final.compute_total_truth_pressure()
+        improvement = prediction.compute_improvement_score()
+        stable = final.is_stable()
+
+        parts = [f"""
 # CASCADE TEMPORAL PREDICTION
 ## {practice_name} - {prediction.time_horizon_days} Day Forecast
 
 ### Initial State (Day 0)
-- **Sovereignty Score**: {initial.compute_sovereignty_score():.2f}
-- **Truth Pressure**: {initial.compute_total_truth_pressure():.2f}
+- **Sovereignty Score**: {init_sov:.2f}
+- **Truth Pressure**: {init_tp:.2f}
 - **Coherence**: {initial.coherence:.2f}
 - **Agency**: {initial.agency:.2f}
 - **Drift**: {initial.drift:.2f}
 
 ### Predicted Final State (Day {prediction.time_horizon_days})
-- **Sovereignty Score**: {final.compute_sovereignty_score():.2f} (Δ {final.compute_sovereignty_score() - initial.compute_sovereignty_score():+.2f})
-- **Truth Pressure**: {final.compute_total_truth_pressure():.2f} (Δ {final.compute_total_truth_pressure() - initial.compute_total_truth_pressure():+.2f})
+- **Sovereignty Score**: {final_sov:.2f} (Δ {final_sov - init_sov:+.2f})
+- **Truth Pressure**: {final_tp:.2f} (Δ {final_tp - init_tp:+.2f})
 - **Coherence**: {final.coherence:.2f} (Δ {final.coherence - initial.coherence:+.2f})
 - **Agency**: {final.agency:.2f} (Δ {final.agency - initial.agency:+.2f})
 - **Drift**: {final.drift:.2f} (Δ {final.drift - initial.drift:+.2f})
@@ -725,37 +1234,37 @@ Final Distribution:
 ```
 
 ### Predicted Cascade Events
-"""
-        
+"""]
+
         if prediction.cascade_days:
-            report += f"**{len(prediction.cascade_days)} cascade(s) predicted:**\n"
+            parts.append(f"**{len(prediction.cascade_days)} cascade(s) predicted:**\n")
             for day in prediction.cascade_days:
-                report += f"- Day {day}\n"
+                parts.append(f"- Day {day}\n")
         else:
-            report += "**No cascades predicted** (stable evolution)\n"
-        
-        report += "\n### Early Warnings\n"
+            parts.append("**No cascades predicted** (stable evolution)\n")
+
+        parts.append("\n### Early Warnings\n")
         warnings = prediction.detect_warning_signs()
         if warnings:
             for day, warning in warnings[:5]:  # First 5
-                report += f"- **Day {day}**: {warning}\n"
+                parts.append(f"- **Day {day}**: {warning}\n")
         else:
-            report += "*No warnings detected* ✓\n"
-        
-        report += f"""
+            parts.append("*No warnings detected* ✓\n")
+
+        parts.append(f"""
 
 ### Overall Assessment
-- **Improvement Score**: {prediction.compute_improvement_score():.2f}
-- **Trajectory Stability**: {'Stable' if final.is_stable() else 'Unstable'}
-- **Recommended**: {'Yes' if prediction.compute_improvement_score() > 0 and final.is_stable() else 'Caution'}
+- **Improvement Score**: {improvement:.2f}
+- **Trajectory Stability**: {'Stable' if stable else 'Unstable'}
+- **Recommended**: {'Yes' if improvement > 0 and stable else 'Caution'}
 
 ---
 
 *Temporal prediction by CASCADE Oracle*
 *Confidence intervals available in detailed data export*
-"""
-        
-        return report
+""")
+
+        return "".join(parts)
 
 # =========================
 # DEMONSTRATION
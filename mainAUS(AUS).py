@@ -8,25 +8,47 @@ import sys
 import os
 import subprocess
 import argparse
+import asyncio
 from typing import List, Dict
 import importlib.util
 
-def check_dependencies():
+def check_dependencies(use_cache: bool = True):
     """Check and install required dependencies"""
     required = ['numpy', 'matplotlib', 'networkx', 'scipy']
+
+    # Fast path: a marker file keyed on the requirement list lets warm
+    # runs skip the find_spec scan and any pip invocation entirely
+    import hashlib
+    key = hashlib.sha1(",".join(sorted(required)).encode()).hexdigest()
+    marker = os.path.join(os.path.expanduser("~"), ".cache", "aura", "deps.ok")
+
+    if use_cache:
+        try:
+            with open(marker) as f:
+                if f.read().strip() == key:
+                    return
+        except OSError:
+            pass
+
     missing = []
-    
     for package in required:
         spec = importlib.util.find_spec(package)
         if spec is None:
             missing.append(package)
-    
+
     if missing:
         print(f"⚠️ Missing packages: {missing}")
         print("Installing via pip...")
         subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing)
         print("✓ Dependencies installed")
 
+    try:
+        os.makedirs(os.path.dirname(marker), exist_ok=True)
+        with open(marker, 'w') as f:
+            f.write(key)
+    except OSError:
+        pass
+
 def run_unified_field():
     """Run Unified Field Theory demonstration"""
     print("\n" + "="*70)
@@ -65,16 +87,19 @@ def run_conscious_ai():
     print("Implementation in progress...")
     return {"status": "pending"}
 
-def run_integrated_demo(all_systems: bool = True, selected: List[str] = None):
-    """Run integrated demonstration of selected systems"""
-    
+async def run_integrated_demo(all_systems: bool = True, selected: List[str] = None,
+                              use_dep_cache: bool = True, pretty_report: bool = False):
+    """Run integrated demonstration of selected systems concurrently"""
+    import time
+    import json
+
     print("="*80)
     print("AURA UNIFIED SYSTEM - INTEGRATED DEMONSTRATION")
     print("Connecting: Physics × Consciousness × AI × Knowledge × Governance")
     print("="*80)
-    
+
     # Check dependencies
-    check_dependencies()
+    check_dependencies(use_cache=use_dep_cache)
     
     # System mappings
     systems = {
@@ -109,20 +134,25 @@ def run_integrated_demo(all_systems: bool = True, selected: List[str] = None):
         # Default: run first two
         systems_to_run = dict(list(systems.items())[:2])
     
-    # Run selected systems
+    # Run selected systems concurrently - the demos are independent,
+    # so overlap them in worker threads instead of a sequential loop
     results = {}
-    
+
+    tasks = []
     for sys_id, sys_info in systems_to_run.items():
         print(f"\n🚀 Starting: {sys_info['name']}")
         print(f"   {sys_info['description']}")
-        
-        try:
-            result = sys_info['function']()
+        tasks.append(asyncio.create_task(asyncio.to_thread(sys_info['function'])))
+
+    results_list = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for (sys_id, sys_info), result in zip(systems_to_run.items(), results_list):
+        if isinstance(result, BaseException):
+            print(f"✗ {sys_info['name']} failed: {result}")
+            results[sys_id] = {"error": str(result)}
+        else:
             results[sys_id] = result
             print(f"✓ {sys_info['name']} completed successfully")
-        except Exception as e:
-            print(f"✗ {sys_info['name']} failed: {e}")
-            results[sys_id] = {"error": str(e)}
     
     # Generate integrated report
     print("\n" + "="*80)
@@ -141,24 +171,33 @@ def run_integrated_demo(all_systems: bool = True, selected: List[str] = None):
         for sys in failed:
             print(f"   • {systems[sys]['name']}: {results[sys].get('error', 'Unknown error')}")
     
-    # Save integrated results
-    integrated_report = {
-        'timestamp': time.time(),
-        'systems_run': list(systems_to_run.keys()),
-        'results_summary': {
-            sys_id: {
-                'success': not results[sys_id].get('error'),
-                'error': results[sys_id].get('error'),
-                'execution_time': results[sys_id].get('execution_time', 0)
+    # Save integrated results - but only when at least one system
+    # produced real output; all-pending placeholder runs skip the write
+    reportable = any(
+        not v.get('error') and v.get('status') != 'pending'
+        for v in results.values() if isinstance(v, dict)
+    )
+    if reportable:
+        integrated_report = {
+            'timestamp': time.time(),
+            'systems_run': list(systems_to_run.keys()),
+            'results_summary': {
+                sys_id: {
+                    'success': not results[sys_id].get('error'),
+                    'error': results[sys_id].get('error'),
+                    'execution_time': results[sys_id].get('execution_time', 0)
+                }
+                for sys_id in systems_to_run.keys()
             }
-            for sys_id in systems_to_run.keys()
         }
-    }
-    
-    with open('aura_integrated_report.json', 'w') as f:
-        json.dump(integrated_report, f, indent=2)
-    
-    print(f"\n💾 Integrated report saved to 'aura_integrated_report.json'")
+
+        with open('aura_integrated_report.json', 'w') as f:
+            if pretty_report:
+                json.dump(integrated_report, f, indent=2)
+            else:
+                json.dump(integrated_report, f, separators=(',', ':'))
+
+        print(f"\n💾 Integrated report saved to 'aura_integrated_report.json'")
     
     # Next steps
     print("\n" + "="*80)
@@ -189,6 +228,10 @@ def main():
                        help='Run Conscious AI only')
     parser.add_argument('--quick', action='store_true',
                        help='Quick demo (first two systems)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Force a full dependency recheck')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent the integrated JSON report')
     
     args = parser.parse_args()
     
@@ -213,9 +256,9 @@ def main():
             selected = ['unified_field', 'knowledge_genome']
     
     # Run integrated demo
-    run_integrated_demo(all_systems=False, selected=selected)
+    asyncio.run(run_integrated_demo(all_systems=False, selected=selected,
+                                    use_dep_cache=not args.no_cache,
+                                    pretty_report=args.pretty))
 
 if __name__ == "__main__":
-    import time
-    import json
     main()
\ No newline at end of file
@@ -10,17 +10,67 @@ Deep analysis tools for the Sovereign Mystery School system:
 - AURA drift detection
 """
 
+import asyncio
 import numpy as np
-from typing import List, Dict, Tuple
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
 from mystery_school_cascade import (
     AwarenessPhase, PyramidLayer, KnowledgeBlock,
-    StudentProgress, SovereignMysterySchool, AURAMetrics
+    StudentProgress, SovereignMysterySchool, AURAMetrics,
+    EVENT_PHASE_ADVANCEMENT, EVENT_BLOCK_COMPLETION
 )
 
 
+# Risk factor bitmask flags returned by the cascade-risk kernel
+_RISK_EDGE_RISING = 1
+_RISK_MIDDLE_EXCEEDING = 2
+_RISK_FOUNDATION_VARIANCE = 4
+_RISK_CASCADE_HISTORY = 8
+
+
+def _cascade_risk_kernel(foundation: np.ndarray, middle: np.ndarray,
+                         edge: np.ndarray, n_cascades: int):
+    """
+    Tight numeric body of predict_cascade_risk.
+
+    Operates on the curriculum's contiguous layer score arrays and
+    returns (risk_score, flags, foundation_mean, foundation_std,
+    middle_exceeding), with flags as a bitmask of _RISK_* constants.
+    """
+    foundation_mean = float(foundation.mean())
+    foundation_std = float(foundation.std())
+
+    risk_score = 0.0
+    flags = 0
+    middle_exceeding = 0
+
+    # Factor 1: Edge practices approaching foundation level
+    if edge.size and edge.max() > foundation_mean * 0.7:
+        flags |= _RISK_EDGE_RISING
+        risk_score += 0.3
+
+    # Factor 2: Middle practices exceeding foundation mean
+    if middle.size:
+        middle_exceeding = int((middle > foundation_mean).sum())
+        if middle_exceeding > 0:
+            flags |= _RISK_MIDDLE_EXCEEDING
+            risk_score += 0.2 * (middle_exceeding / middle.size)
+
+    # Factor 3: High variance in foundation (instability)
+    if foundation_std > foundation_mean * 0.4:
+        flags |= _RISK_FOUNDATION_VARIANCE
+        risk_score += 0.25
+
+    # Factor 4: Recent cascade activity
+    if n_cascades > 0:
+        flags |= _RISK_CASCADE_HISTORY
+        risk_score += min(0.25, n_cascades * 0.1)
+
+    return risk_score, flags, foundation_mean, foundation_std, middle_exceeding
+
+
 @dataclass
 class CohortMetrics:
     """Aggregated metrics for a group of students"""
@@ -57,7 +107,7 @@ class MysterySchoolAnalytics:
         # Extract phase transitions from transformation log
         phase_transitions = [
             event for event in student.transformation_log
-            if event.get('event') == 'phase_advancement'
+            if event.kind == EVENT_PHASE_ADVANCEMENT
         ]
         
         if not phase_transitions:
@@ -70,16 +120,14 @@ class MysterySchoolAnalytics:
             }
         
         # Calculate metrics
-        days_per_phase = [t['days_in_phase'] for t in phase_transitions]
+        days_per_phase = [t.days_in_phase for t in phase_transitions]
         avg_days = np.mean(days_per_phase)
-        
+
         # Phase frequency
-        phase_times = {}
+        phase_times = Counter()
         for trans in phase_transitions:
-            phase = trans['from_phase']
-            days = trans['days_in_phase']
-            phase_times[phase] = phase_times.get(phase, 0) + days
-        
+            phase_times[trans.from_phase] += trans.days_in_phase
+
         longest_phase = max(phase_times.items(), key=lambda x: x[1])
         
         # Predict next transition
@@ -129,45 +177,41 @@ class MysterySchoolAnalytics:
                 "message": "No students have completed this practice yet"
             }
         
-        # Calculate AURA improvements
-        aura_improvements = []
+        # Calculate AURA improvements: gather post-completion metrics into
+        # one (N, 3) matrix and take a single vectorized mean against the
+        # block baseline instead of per-completer dicts
+        post_rows = []
+        phase_completions = Counter()
         for student in completers:
-            # Find the AURA metrics before and after this practice
-            completion_event = next(
-                (e for e in student.transformation_log 
-                 if e.get('block') == practice_name),
-                None
-            )
-            
+            # Index this student's block events once instead of scanning
+            # the transformation log for every lookup
+            block_events = {e.block: e for e in student.transformation_log
+                            if e.kind == EVENT_BLOCK_COMPLETION}
+            completion_event = block_events.get(practice_name)
+
+            if completion_event:
+                phase_completions[completion_event.phase or 'Unknown'] += 1
+
             if completion_event and student.aura_history:
-                completion_time = datetime.fromisoformat(completion_event['timestamp'])
-                
-                # Find nearest AURA measurement after completion
-                post_metrics = next(
-                    (m for t, m in student.aura_history if t >= completion_time),
-                    None
-                )
-                
+                # Binary search the time-sorted history for the nearest
+                # AURA measurement after completion
+                completion_ns = np.datetime64(completion_event.ts, 'ns').astype(np.int64)
+                idx = int(np.searchsorted(student.aura_timestamps(), completion_ns))
+                post_metrics = (student.aura_history[idx][1]
+                                if idx < len(student.aura_history) else None)
+
                 if post_metrics and block.aura_metrics:
-                    improvement = {
-                        'TES': post_metrics.TES - block.aura_metrics.TES,
-                        'VTR': post_metrics.VTR - block.aura_metrics.VTR,
-                        'PAI': post_metrics.PAI - block.aura_metrics.PAI
-                    }
-                    aura_improvements.append(improvement)
+                    post_rows.append(
+                        (post_metrics.TES, post_metrics.VTR, post_metrics.PAI))
+
+        if post_rows and block.aura_metrics:
+            baseline = np.array(
+                [block.aura_metrics.TES, block.aura_metrics.VTR, block.aura_metrics.PAI])
+            avg_improvement = np.asarray(post_rows).mean(axis=0) - baseline
+        else:
+            avg_improvement = None
         
         # Phase alignment analysis
-        phase_completions = {}
-        for student in completers:
-            completion_event = next(
-                (e for e in student.transformation_log 
-                 if e.get('block') == practice_name),
-                None
-            )
-            if completion_event:
-                phase = completion_event.get('phase', 'Unknown')
-                phase_completions[phase] = phase_completions.get(phase, 0) + 1
-        
         dominant_phase = max(phase_completions.items(), key=lambda x: x[1])[0] if phase_completions else None
         
         return {
@@ -178,11 +222,11 @@ class MysterySchoolAnalytics:
             "completers": len(completers),
             "completion_rate": round(len(completers) / max(len(self.school.students), 1), 3),
             "avg_aura_improvement": {
-                'TES': round(np.mean([i['TES'] for i in aura_improvements]), 3) if aura_improvements else None,
-                'VTR': round(np.mean([i['VTR'] for i in aura_improvements]), 3) if aura_improvements else None,
-                'PAI': round(np.mean([i['PAI'] for i in aura_improvements]), 3) if aura_improvements else None
+                'TES': round(float(avg_improvement[0]), 3) if avg_improvement is not None else None,
+                'VTR': round(float(avg_improvement[1]), 3) if avg_improvement is not None else None,
+                'PAI': round(float(avg_improvement[2]), 3) if avg_improvement is not None else None
             },
-            "phase_distribution": phase_completions,
+            "phase_distribution": dict(phase_completions),
             "dominant_completion_phase": dominant_phase,
             "phase_alignment_match": (dominant_phase == block.phase_affinity.symbol) if block.phase_affinity else None
         }
@@ -196,50 +240,31 @@ class MysterySchoolAnalytics:
         - Foundation practices showing evidence decay
         - Large compression score variance within layers
         """
-        foundation_blocks = self.school.curriculum.get_blocks_by_layer(PyramidLayer.FOUNDATION)
-        middle_blocks = self.school.curriculum.get_blocks_by_layer(PyramidLayer.MIDDLE)
-        edge_blocks = self.school.curriculum.get_blocks_by_layer(PyramidLayer.EDGE)
-        
-        if not foundation_blocks:
+        curriculum = self.school.curriculum
+        foundation_scores = curriculum.layer_scores(PyramidLayer.FOUNDATION)
+        middle_scores = curriculum.layer_scores(PyramidLayer.MIDDLE)
+        edge_scores = curriculum.layer_scores(PyramidLayer.EDGE)
+
+        if foundation_scores.size == 0:
             return {"risk": "unknown", "message": "No foundation blocks"}
-        
-        # Calculate statistics
-        foundation_scores = [b.compression_score for b in foundation_blocks]
-        middle_scores = [b.compression_score for b in middle_blocks] if middle_blocks else []
-        edge_scores = [b.compression_score for b in edge_blocks] if edge_blocks else []
-        
-        foundation_mean = np.mean(foundation_scores)
-        foundation_std = np.std(foundation_scores)
-        
-        # Risk factors
+
+        # Numeric scoring runs in the extracted kernel; translate its
+        # flag bitmask back into human-readable factor strings here
+        recent_cascades = len(self.school.cascade_engine.cascade_history)
+        (risk_score, flags, foundation_mean, foundation_std,
+         middle_exceeding) = _cascade_risk_kernel(
+            foundation_scores, middle_scores, edge_scores, recent_cascades)
+
         risk_factors = []
-        risk_score = 0.0
-        
-        # Factor 1: Edge practices approaching foundation level
-        if edge_scores:
-            top_edge = max(edge_scores)
-            if top_edge > foundation_mean * 0.7:
-                risk_factors.append("High-performing Edge practice detected")
-                risk_score += 0.3
-        
-        # Factor 2: Middle practices exceeding foundation mean
-        if middle_scores:
-            middle_exceeding = sum(1 for s in middle_scores if s > foundation_mean)
-            if middle_exceeding > 0:
-                risk_factors.append(f"{middle_exceeding} Middle practices exceeding Foundation average")
-                risk_score += 0.2 * (middle_exceeding / len(middle_scores))
-        
-        # Factor 3: High variance in foundation (instability)
-        if foundation_std > foundation_mean * 0.4:
+        if flags & _RISK_EDGE_RISING:
+            risk_factors.append("High-performing Edge practice detected")
+        if flags & _RISK_MIDDLE_EXCEEDING:
+            risk_factors.append(f"{middle_exceeding} Middle practices exceeding Foundation average")
+        if flags & _RISK_FOUNDATION_VARIANCE:
             risk_factors.append("High variance in Foundation layer")
-            risk_score += 0.25
-        
-        # Factor 4: Recent cascade activity
-        recent_cascades = len(self.school.cascade_engine.cascade_history)
-        if recent_cascades > 0:
+        if flags & _RISK_CASCADE_HISTORY:
             risk_factors.append(f"{recent_cascades} cascade events in history")
-            risk_score += min(0.25, recent_cascades * 0.1)
-        
+
         # Determine risk level
         if risk_score < 0.3:
             risk_level = "LOW"
@@ -252,14 +277,14 @@ class MysterySchoolAnalytics:
             "risk_level": risk_level,
             "risk_score": round(risk_score, 3),
             "foundation_stability": {
-                "mean_compression": round(foundation_mean, 3),
-                "std_dev": round(foundation_std, 3),
-                "count": len(foundation_blocks)
+                "mean_compression": round(float(foundation_mean), 3),
+                "std_dev": round(float(foundation_std), 3),
+                "count": int(foundation_scores.size)
             },
             "layer_dynamics": {
-                "edge_max": round(max(edge_scores), 3) if edge_scores else 0,
-                "middle_max": round(max(middle_scores), 3) if middle_scores else 0,
-                "foundation_min": round(min(foundation_scores), 3)
+                "edge_max": round(float(edge_scores.max()), 3) if edge_scores.size else 0,
+                "middle_max": round(float(middle_scores.max()), 3) if middle_scores.size else 0,
+                "foundation_min": round(float(foundation_scores.min()), 3)
             },
             "risk_factors": risk_factors,
             "cascade_history": recent_cascades,
@@ -297,20 +322,25 @@ class MysterySchoolAnalytics:
             if s.current_aura_metrics
         ]
         
-        phase_dist = {}
-        for s in students:
-            phase = s.current_phase.symbol
-            phase_dist[phase] = phase_dist.get(phase, 0) + 1
+        phase_dist = dict(Counter(s.current_phase.symbol for s in students))
         
-        # Find dominant domains
-        domain_counts = {}
-        for student in students:
-            for block_name in student.completed_blocks:
-                block = self.school.curriculum.get_block(block_name)
-                if block:
-                    domain_counts[block.domain] = domain_counts.get(block.domain, 0) + 1
-        
-        top_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        # Find dominant domains: resolve all completions to domains once,
+        # then count and take the top 3 with one unique/argpartition pass
+        get_block = self.school.curriculum.get_block
+        domains = [block.domain
+                   for student in students
+                   for block_name in student.completed_blocks
+                   if (block := get_block(block_name))]
+
+        if domains:
+            unique_domains, counts = np.unique(np.array(domains, dtype=object),
+                                               return_counts=True)
+            top_k = min(3, len(unique_domains))
+            top_idx = np.argpartition(-counts, top_k - 1)[:top_k]
+            top_idx = top_idx[np.argsort(-counts[top_idx])]
+            top_domains = list(unique_domains[top_idx])
+        else:
+            top_domains = []
         
         return CohortMetrics(
             cohort_id=f"cohort_{len(student_ids)}",
@@ -318,7 +348,7 @@ class MysterySchoolAnalytics:
             avg_completion_rate=round(np.mean(completion_rates), 3),
             avg_aura_alignment=round(np.mean(aura_alignments), 3) if aura_alignments else 0.0,
             phase_distribution=phase_dist,
-            dominant_domains=[d[0] for d in top_domains]
+            dominant_domains=top_domains
         )
     
     def detect_aura_drift(self, student_id: str, window_size: int = 5) -> Dict:
@@ -338,25 +368,19 @@ class MysterySchoolAnalytics:
                 "message": f"Need at least {window_size} measurements"
             }
         
-        # Extract recent metrics
-        recent = student.aura_history[-window_size:]
-        tes_values = [m.TES for t, m in recent]
-        vtr_values = [m.VTR for t, m in recent]
-        pai_values = [m.PAI for t, m in recent]
-        
-        # Calculate trends
-        tes_trend = tes_values[-1] - tes_values[0]
-        vtr_trend = vtr_values[-1] - vtr_values[0]
-        pai_trend = pai_values[-1] - pai_values[0]
-        
-        # Detect drift
-        drift_flags = []
-        if tes_trend < -0.1:
-            drift_flags.append("TES declining")
-        if vtr_trend < -0.2:
-            drift_flags.append("VTR declining")
-        if pai_trend < -0.1:
-            drift_flags.append("PAI declining")
+        # Read the recent window straight off the SoA metric columns
+        tes, vtr, pai = student.aura_history.as_view()
+        metrics = np.stack((tes[-window_size:], vtr[-window_size:],
+                            pai[-window_size:]), axis=1)
+
+        # Calculate trends and flag drift in one vectorized comparison
+        trends = metrics[-1] - metrics[0]
+        tes_trend, vtr_trend, pai_trend = trends
+
+        drift_thresholds = np.array([-0.1, -0.2, -0.1])
+        metric_names = ("TES declining", "VTR declining", "PAI declining")
+        drift_flags = [name for name, drifting
+                       in zip(metric_names, trends < drift_thresholds) if drifting]
         
         current = student.current_aura_metrics
         
@@ -371,13 +395,36 @@ class MysterySchoolAnalytics:
                 "aligned": current.is_aligned()
             },
             "trends": {
-                "TES": round(tes_trend, 3),
-                "VTR": round(vtr_trend, 3),
-                "PAI": round(pai_trend, 3)
+                "TES": round(float(tes_trend), 3),
+                "VTR": round(float(vtr_trend), 3),
+                "PAI": round(float(pai_trend), 3)
             },
             "recommendation": "Review recent practices and consider additional support" if drift_flags else "Metrics stable"
         }
 
+    # Async wrappers: run the CPU-bound analyses in worker threads so a
+    # dashboard can overlap a whole cohort with asyncio.gather
+    async def analyze_phase_transitions_async(self, student_id: str) -> Dict:
+        """Async wrapper around analyze_phase_transitions."""
+        return await asyncio.to_thread(self.analyze_phase_transitions, student_id)
+
+    async def analyze_practice_efficacy_async(self, practice_name: str) -> Dict:
+        """Async wrapper around analyze_practice_efficacy."""
+        return await asyncio.to_thread(self.analyze_practice_efficacy, practice_name)
+
+    async def detect_aura_drift_async(self, student_id: str,
+                                      window_size: int = 5) -> Dict:
+        """Async wrapper around detect_aura_drift."""
+        return await asyncio.to_thread(self.detect_aura_drift, student_id, window_size)
+
+    async def analyze_all_students(self, student_ids: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Run drift detection for a whole cohort concurrently."""
+        if student_ids is None:
+            student_ids = list(self.school.students.keys())
+        results = await asyncio.gather(
+            *(self.detect_aura_drift_async(sid) for sid in student_ids))
+        return dict(zip(student_ids, results))
+
 
 # Demo function
 def demo_analytics():
@@ -20,10 +20,13 @@ License: Sovereign - Open for educational use
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, NamedTuple
+from collections import deque
 from enum import Enum
 import numpy as np
 from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
+from sortedcontainers import SortedList
 import json
 import math
 
@@ -79,30 +82,44 @@ class PyramidLayer(Enum):
 # AURA CONSTITUTIONAL METRICS
 # ============================================================================
 
-@dataclass
+# Reciprocals of the AURA Prime thresholds, folded once at import so
+# the hot alignment paths multiply instead of divide
+_TES_INV = 1.0 / 0.70
+_VTR_INV = 1.0 / 1.5
+_PAI_INV = 1.0 / 0.80
+
+
+@dataclass(slots=True)
 class AURAMetrics:
     """Tri-Axial ethical alignment scores"""
     TES: float  # Trust Entropy Score (stability) - target > 0.70
     VTR: float  # Value-Transfer Ratio (generativity) - target > 1.5
     PAI: float  # Purpose Alignment Index (direction) - target > 0.80
-    
+
     def is_aligned(self) -> bool:
         """Check if all metrics meet AURA Prime thresholds"""
         return self.TES > 0.70 and self.VTR > 1.5 and self.PAI > 0.80
-    
+
     def alignment_score(self) -> float:
         """Composite alignment measure (0-1 scale)"""
-        tes_norm = min(self.TES / 0.70, 1.0)
-        vtr_norm = min(self.VTR / 1.5, 1.0)
-        pai_norm = min(self.PAI / 0.80, 1.0)
-        return (tes_norm + vtr_norm + pai_norm) / 3.0
+        return (min(self.TES * _TES_INV, 1.0) +
+                min(self.VTR * _VTR_INV, 1.0) +
+                min(self.PAI * _PAI_INV, 1.0)) / 3.0
+
+    @staticmethod
+    def alignment_score_batch(tes: np.ndarray, vtr: np.ndarray,
+                              pai: np.ndarray) -> np.ndarray:
+        """Vectorized alignment_score over parallel metric arrays"""
+        return (np.minimum(tes * _TES_INV, 1.0) +
+                np.minimum(vtr * _VTR_INV, 1.0) +
+                np.minimum(pai * _PAI_INV, 1.0)) / 3.0
 
 
 # ============================================================================
 # KNOWLEDGE BLOCK (Pyramid Unit)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeBlock:
     """
     A discrete unit of knowledge in the Mystery School curriculum.
@@ -126,30 +143,41 @@ class KnowledgeBlock:
     prerequisites: List[str] = field(default_factory=list)
     aura_metrics: Optional[AURAMetrics] = None
     phase_affinity: Optional[AwarenessPhase] = None
-    
+    block_id: int = field(init=False, default=-1, repr=False)
+    _score: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._recompute_score()
+
+    def _recompute_score(self):
+        """Refresh the cached score after evidence/power/entropy change"""
+        if self.entropy == 0:
+            self._score = float('inf')
+        else:
+            self._score = (self.evidence * self.power) / self.entropy
+
     @property
     def compression_score(self) -> float:
         """
         Π = (Evidence × Power) / Entropy
-        
+
         The "weight" of this knowledge block.
         Higher scores indicate heavier, more fundamental truths.
+        Cached in _score; hot paths read the field directly.
         """
-        if self.entropy == 0:
-            return float('inf')
-        return (self.evidence * self.power) / self.entropy
-    
+        return self._score
+
     @property
     def truth_pressure(self) -> float:
         """Alias for compression_score using document terminology"""
-        return self.compression_score
+        return self._score
     
     def can_cascade(self, foundation_threshold: float = 1.5) -> bool:
         """
         Determines if this block has sufficient weight to trigger
         a cascade (paradigm shift) in the pyramid.
         """
-        return self.compression_score > foundation_threshold
+        return self._score > foundation_threshold
 
 
 # ============================================================================
@@ -163,9 +191,45 @@ class MysterySchoolCurriculum:
     """
     
     def __init__(self):
-        self.blocks: Dict[str, KnowledgeBlock] = {}
-        self._initialize_curriculum()
-    
+        self._blocks: Dict[str, KnowledgeBlock] = {}
+        self._layer_scores: Dict[PyramidLayer, np.ndarray] = {}
+        self._scores_dirty = True
+        # Bumped on every structural/score mutation so downstream caches
+        # (e.g. the curriculum report) can cheaply detect staleness
+        self._mutations = 0
+        # Inverted indices of block names, maintained on every mutation.
+        # Inner dicts are used as ordered sets so listings stay in
+        # registration order.
+        self._by_layer: Dict[PyramidLayer, Dict[str, None]] = {
+            tier: {} for tier in PyramidLayer
+        }
+        self._by_domain: Dict[str, Dict[str, None]] = {}
+        self._by_phase: Dict[AwarenessPhase, Dict[str, None]] = {}
+        # Dense integer IDs assigned at registration: hot callers can
+        # hold an id and skip string hashing on long block names
+        self._by_id: List[KnowledgeBlock] = []
+        self._name_to_id: Dict[str, int] = {}
+        # (score, name) pairs kept densest-first so cascades read rank
+        # cutoffs by index instead of re-sorting every block
+        self._score_order: SortedList = SortedList(key=lambda entry: -entry[0])
+        # The seeded syllabus is materialized on first access rather than
+        # here, so instances that never touch the registry (or only hold
+        # cached report state) skip ~11 block constructions
+        self._seeded = False
+
+    @property
+    def blocks(self) -> Dict[str, KnowledgeBlock]:
+        """Name -> block registry, seeding the syllabus on first access"""
+        self._ensure_seeded()
+        return self._blocks
+
+    def _ensure_seeded(self):
+        """Materialize the initial syllabus exactly once, on demand"""
+        if not self._seeded:
+            # Flag first: add_block calls back into the guard
+            self._seeded = True
+            self._initialize_curriculum()
+
     def _initialize_curriculum(self):
         """Load initial curriculum from the comprehensive syllabus"""
         
@@ -302,30 +366,102 @@ class MysterySchoolCurriculum:
     
     def add_block(self, block: KnowledgeBlock):
         """Register a knowledge block in the curriculum"""
-        self.blocks[block.name] = block
-    
+        self._ensure_seeded()
+        block.block_id = len(self._by_id)
+        self._by_id.append(block)
+        self._name_to_id[block.name] = block.block_id
+        self._blocks[block.name] = block
+        self._by_layer[block.layer][block.name] = None
+        self._by_domain.setdefault(block.domain, {})[block.name] = None
+        if block.phase_affinity is not None:
+            self._by_phase.setdefault(block.phase_affinity, {})[block.name] = None
+        self._score_order.add((block._score, block.name))
+        self._scores_dirty = True
+        self._mutations += 1
+
+    def move_layer(self, name: str, new_layer: PyramidLayer):
+        """Reassign a block's layer, keeping the inverted index in sync"""
+        block = self.blocks[name]
+        if block.layer is new_layer:
+            return
+        self._by_layer[block.layer].pop(name, None)
+        self._by_layer[new_layer][name] = None
+        block.layer = new_layer
+        self._scores_dirty = True
+        self._mutations += 1
+
+    def invalidate_scores(self):
+        """Mark cached layer score arrays stale after a block mutation"""
+        self._scores_dirty = True
+        self._mutations += 1
+
+    def rescore_block(self, name: str, old_score: float):
+        """Re-slot a block in the score order after its score changed"""
+        self._score_order.remove((old_score, name))
+        self._score_order.add((self._blocks[name]._score, name))
+        self._scores_dirty = True
+        self._mutations += 1
+
+    def layer_scores(self, layer: PyramidLayer) -> np.ndarray:
+        """
+        Compression scores for a layer as a cached NumPy array.
+
+        Rebuilt lazily after block additions, promotions, or evidence
+        updates so repeated risk analyses operate on ready-made arrays.
+        Stored as float32: half the bytes of float64 with precision to
+        spare for threshold comparisons, and still able to hold the
+        unbounded (even infinite) scores a zero-entropy block produces.
+        """
+        if self._scores_dirty:
+            for tier in PyramidLayer:
+                self._layer_scores[tier] = np.array(
+                    [b._score for b in self.blocks.values()
+                     if b.layer == tier],
+                    dtype=np.float32
+                )
+            self._scores_dirty = False
+        return self._layer_scores[layer]
+
     def get_block(self, name: str) -> Optional[KnowledgeBlock]:
         """Retrieve a knowledge block by name"""
         return self.blocks.get(name)
-    
+
+    def get_block_by_id(self, block_id: int) -> Optional[KnowledgeBlock]:
+        """Retrieve a knowledge block by its dense integer ID"""
+        self._ensure_seeded()
+        if 0 <= block_id < len(self._by_id):
+            return self._by_id[block_id]
+        return None
+
     def get_blocks_by_layer(self, layer: PyramidLayer) -> List[KnowledgeBlock]:
         """Get all blocks at a specific validation tier"""
-        return [b for b in self.blocks.values() if b.layer == layer]
-    
+        self._ensure_seeded()
+        return [self._blocks[name] for name in self._by_layer[layer]]
+
     def get_blocks_by_domain(self, domain: str) -> List[KnowledgeBlock]:
         """Get all blocks in a subject area"""
-        return [b for b in self.blocks.values() if b.domain == domain]
-    
+        self._ensure_seeded()
+        return [self._blocks[name] for name in self._by_domain.get(domain, ())]
+
     def get_blocks_by_phase(self, phase: AwarenessPhase) -> List[KnowledgeBlock]:
         """Get blocks aligned with a specific awareness phase"""
-        return [b for b in self.blocks.values() 
-                if b.phase_affinity == phase]
+        self._ensure_seeded()
+        return [self._blocks[name] for name in self._by_phase.get(phase, ())]
 
 
 # ============================================================================
 # PYRAMID CASCADE ENGINE
 # ============================================================================
 
+# Cascade rank bands, densest truth first: top 25% -> Foundation,
+# through 65% -> Middle, rest -> Edge
+_RANK_LAYERS = (PyramidLayer.FOUNDATION, PyramidLayer.MIDDLE, PyramidLayer.EDGE)
+
+# Score boundaries for layer classification: searchsorted over these
+# gives a branchless code into _SCORE_LAYERS (0=Edge, 1=Middle, 2=Foundation)
+_LAYER_BOUNDS = np.array([0.5, 1.2])
+_SCORE_LAYERS = (PyramidLayer.EDGE, PyramidLayer.MIDDLE, PyramidLayer.FOUNDATION)
+
 class PyramidCascadeEngine:
     """
     Manages the dynamic reorganization of knowledge blocks
@@ -362,16 +498,13 @@ class PyramidCascadeEngine:
         # Update metrics
         block.evidence = new_evidence
         block.entropy = new_entropy
-        new_score = block.compression_score
+        block._recompute_score()
+        self.curriculum.rescore_block(block_name, old_score)
+        new_score = block._score
         
         # Determine appropriate layer based on compression score
-        if new_score < 0.5:
-            target_layer = PyramidLayer.EDGE
-        elif new_score < 1.2:
-            target_layer = PyramidLayer.MIDDLE
-        else:
-            target_layer = PyramidLayer.FOUNDATION
-        
+        target_layer = _SCORE_LAYERS[np.searchsorted(_LAYER_BOUNDS, new_score, side='right')]
+
         # Check for layer change
         layer_changed = (target_layer != old_layer)
         
@@ -386,11 +519,48 @@ class PyramidCascadeEngine:
         }
         
         if layer_changed:
-            block.layer = target_layer
+            self.curriculum.move_layer(block_name, target_layer)
             result["cascade_triggered"] = self._check_cascade(block)
-        
+
         return result
-    
+
+    def evaluate_bulk(self, block_names: List[str],
+                      new_evidences: np.ndarray,
+                      new_entropies: np.ndarray) -> np.ndarray:
+        """
+        Re-evaluate many blocks at once with vectorized classification.
+
+        Scores and target layers are computed in one pass of array math
+        (searchsorted over the shared boundaries), then only the blocks
+        whose layer actually changed pay the per-block move and cascade
+        check. Returns the int8 layer code per block indexing
+        _SCORE_LAYERS.
+        """
+        blocks = [self.curriculum.blocks[name] for name in block_names]
+        evidences = np.asarray(new_evidences, dtype=np.float64)
+        entropies = np.asarray(new_entropies, dtype=np.float64)
+        powers = np.fromiter((b.power for b in blocks),
+                             dtype=np.float64, count=len(blocks))
+
+        with np.errstate(divide='ignore'):
+            scores = np.where(entropies == 0, np.inf,
+                              evidences * powers / np.where(entropies == 0, 1, entropies))
+        codes = np.searchsorted(_LAYER_BOUNDS, scores, side='right').astype(np.int8)
+
+        for block, evidence, entropy, score, code in zip(
+                blocks, evidences, entropies, scores, codes):
+            old_score = block._score
+            block.evidence = float(evidence)
+            block.entropy = float(entropy)
+            block._score = float(score)
+            self.curriculum.rescore_block(block.name, old_score)
+            target_layer = _SCORE_LAYERS[code]
+            if target_layer != block.layer:
+                self.curriculum.move_layer(block.name, target_layer)
+                self._check_cascade(block)
+
+        return codes
+
     def _check_cascade(self, promoted_block: KnowledgeBlock) -> bool:
         """
         Check if a promoted block triggers a cascade event.
@@ -410,64 +580,65 @@ class PyramidCascadeEngine:
         if len(foundation_blocks) <= 1:
             return False
         
-        avg_foundation_score = np.mean([
-            b.compression_score for b in foundation_blocks
-        ])
-        
-        if promoted_block.compression_score > avg_foundation_score * 1.3:
+        # Plain sum beats np.mean for a handful of cached floats - no
+        # array construction or ufunc dispatch
+        avg_foundation_score = (
+            sum(b._score for b in foundation_blocks) / len(foundation_blocks)
+        )
+
+        if promoted_block._score > avg_foundation_score * 1.3:
             self._trigger_cascade(promoted_block)
             return True
         
         return False
     
-    def _trigger_cascade(self, catalyst_block: KnowledgeBlock):
+    def _trigger_cascade(self, catalyst_block: KnowledgeBlock,
+                         now: Optional[datetime] = None):
         """
         Execute a cascade event - paradigm shift in knowledge organization.
-        
+
         This represents a fundamental reorganization where:
         - New truth is heavier than current foundation
         - Old foundation blocks may compress up to Middle layer
         - System seeks new equilibrium
         """
+        if now is None:
+            now = datetime.now()
         cascade_event = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "catalyst": catalyst_block.name,
-            "catalyst_score": catalyst_block.compression_score,
+            "catalyst_score": catalyst_block._score,
             "reorganizations": []
         }
         
-        # Get all blocks and sort by compression score
-        all_blocks = list(self.curriculum.blocks.values())
-        sorted_blocks = sorted(
-            all_blocks, 
-            key=lambda b: b.compression_score, 
-            reverse=True
-        )
-        
-        # Redistribute across layers based on new ordering
-        total = len(sorted_blocks)
-        foundation_cutoff = int(total * 0.25)  # Top 25%
-        middle_cutoff = int(total * 0.65)      # Next 40%
-        
-        for i, block in enumerate(sorted_blocks):
-            old_layer = block.layer
-            
-            if i < foundation_cutoff:
-                new_layer = PyramidLayer.FOUNDATION
-            elif i < middle_cutoff:
-                new_layer = PyramidLayer.MIDDLE
+        # The curriculum keeps (score, name) pairs densest-first, so
+        # rank cutoffs are plain index ranges - no per-cascade sort
+        all_blocks = self.curriculum.blocks
+        ordered = list(self.curriculum._score_order)
+        total = len(ordered)
+        foundation_cutoff = int(total * 0.25)
+        middle_cutoff = int(total * 0.65)
+
+        for rank, (score, name) in enumerate(ordered):
+            if rank < foundation_cutoff:
+                new_layer = _RANK_LAYERS[0]
+            elif rank < middle_cutoff:
+                new_layer = _RANK_LAYERS[1]
             else:
-                new_layer = PyramidLayer.EDGE
-            
+                new_layer = _RANK_LAYERS[2]
+
+            block = all_blocks[name]
+            old_layer = block.layer
             if old_layer != new_layer:
-                block.layer = new_layer
+                self.curriculum.move_layer(block.name, new_layer)
                 cascade_event["reorganizations"].append({
                     "block": block.name,
                     "old_layer": old_layer.value,
                     "new_layer": new_layer.value,
-                    "compression": round(block.compression_score, 3)
+                    "compression": round(float(score), 3)
                 })
         
+        self.curriculum.invalidate_scores()
         self.cascade_history.append(cascade_event)
         print(f"\n🌊 CASCADE EVENT TRIGGERED 🌊")
         print(f"Catalyst: {catalyst_block.name}")
@@ -482,11 +653,98 @@ class PyramidCascadeEngine:
 # STUDENT TRANSFORMATION TRACKER
 # ============================================================================
 
-@dataclass
+class AURAHistory:
+    """
+    Struct-of-arrays store for a student's AURA measurements.
+
+    Timestamps live in an int64 nanosecond array and the three metrics
+    in float32 columns, all doubling in capacity on append. Analytics
+    can binary search or reduce the columns directly without touching
+    per-tuple Python objects; iteration and indexing still yield
+    (datetime, AURAMetrics) tuples for existing callers.
+    """
+    __slots__ = ('ts', 'tes', 'vtr', 'pai', '_size')
+
+    def __init__(self):
+        self._size = 0
+        self.ts = np.empty(8, dtype=np.int64)
+        self.tes = np.empty(8, dtype=np.float32)
+        self.vtr = np.empty(8, dtype=np.float32)
+        self.pai = np.empty(8, dtype=np.float32)
+
+    def append(self, timestamp: datetime, metrics: AURAMetrics):
+        """Record one measurement, growing the columns geometrically"""
+        if self._size == len(self.ts):
+            capacity = self._size * 2
+            for name in ('ts', 'tes', 'vtr', 'pai'):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self._size] = column
+                setattr(self, name, grown)
+        i = self._size
+        self.ts[i] = np.datetime64(timestamp, 'ns').astype(np.int64)
+        self.tes[i] = metrics.TES
+        self.vtr[i] = metrics.VTR
+        self.pai[i] = metrics.PAI
+        self._size = i + 1
+
+    def timestamps(self) -> np.ndarray:
+        """Timestamps as int64 nanoseconds since epoch (view)"""
+        return self.ts[:self._size]
+
+    def datetimes(self) -> np.ndarray:
+        """Timestamps as a datetime64[ns] view for range queries"""
+        return self.ts[:self._size].view('datetime64[ns]')
+
+    def as_view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The TES, VTR and PAI columns as trimmed array views"""
+        return (self.tes[:self._size], self.vtr[:self._size],
+                self.pai[:self._size])
+
+    def _entry(self, i: int) -> Tuple[datetime, AURAMetrics]:
+        timestamp = self.ts[i].astype('datetime64[ns]').astype('datetime64[us]').item()
+        metrics = AURAMetrics(TES=float(self.tes[i]), VTR=float(self.vtr[i]),
+                              PAI=float(self.pai[i]))
+        return timestamp, metrics
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return (self._entry(i) for i in range(self._size))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("AURAHistory index out of range")
+        return self._entry(index)
+
+
+# Integer event kinds for TransformationEvent - cheaper to store and
+# compare than the old string-keyed dict entries
+EVENT_PHASE_ADVANCEMENT = 0
+EVENT_BLOCK_COMPLETION = 1
+
+
+class TransformationEvent(NamedTuple):
+    """One milestone in a student's transformation log"""
+    ts: datetime
+    kind: int
+    block: Optional[str] = None
+    phase: Optional[str] = None
+    from_phase: Optional[str] = None
+    to_phase: Optional[str] = None
+    days_in_phase: int = 0
+
+
+@dataclass(slots=True)
 class StudentProgress:
     """
     Track an individual student's journey through the Mystery School.
-    
+
     Integrates:
     - Seven-phase awareness state
     - Completed knowledge blocks
@@ -498,43 +756,67 @@ class StudentProgress:
     phase_entry_date: datetime
     completed_blocks: List[str] = field(default_factory=list)
     current_blocks: List[str] = field(default_factory=list)
-    aura_history: List[Tuple[datetime, AURAMetrics]] = field(default_factory=list)
-    transformation_log: List[Dict] = field(default_factory=list)
-    
-    def advance_phase(self):
+    aura_history: AURAHistory = field(default_factory=AURAHistory)
+    # Bounded ring buffer of compact namedtuple events: long-lived
+    # students stop growing at 10k milestones instead of unboundedly
+    transformation_log: deque = field(
+        default_factory=lambda: deque(maxlen=10_000))
+    _completed_set: Set[str] = field(default_factory=set, repr=False, compare=False)
+    _current_set: Set[str] = field(default_factory=set, repr=False, compare=False)
+
+    def aura_timestamps(self) -> np.ndarray:
+        """Timestamps of aura_history as int64 nanoseconds since epoch"""
+        return self.aura_history.timestamps()
+
+    def advance_phase(self, now: Optional[datetime] = None):
         """Move to next phase in the seven-cycle"""
         phases = list(AwarenessPhase)
         current_index = phases.index(self.current_phase)
         next_index = (current_index + 1) % len(phases)
-        
-        self.transformation_log.append({
-            "timestamp": datetime.now().isoformat(),
-            "event": "phase_advancement",
-            "from_phase": self.current_phase.symbol,
-            "to_phase": phases[next_index].symbol,
-            "days_in_phase": (datetime.now() - self.phase_entry_date).days
-        })
-        
+
+        if now is None:
+            now = datetime.now()
+        self.transformation_log.append(TransformationEvent(
+            ts=now,
+            kind=EVENT_PHASE_ADVANCEMENT,
+            from_phase=self.current_phase.symbol,
+            to_phase=phases[next_index].symbol,
+            days_in_phase=(now - self.phase_entry_date).days
+        ))
+
         self.current_phase = phases[next_index]
-        self.phase_entry_date = datetime.now()
+        self.phase_entry_date = now
     
-    def complete_block(self, block_name: str, 
-                       outcome_metrics: Optional[AURAMetrics] = None):
+    def begin_block(self, block_name: str):
+        """Mark a knowledge block as in progress"""
+        if block_name not in self._current_set:
+            self._current_set.add(block_name)
+            self.current_blocks.append(block_name)
+
+    def complete_block(self, block_name: str,
+                       outcome_metrics: Optional[AURAMetrics] = None,
+                       now: Optional[datetime] = None):
         """Mark a knowledge block as completed"""
-        if block_name in self.current_blocks:
+        # O(1) membership via the mirror set; the list is only touched
+        # when the block really was in progress
+        if block_name in self._current_set:
+            self._current_set.discard(block_name)
             self.current_blocks.remove(block_name)
-        
+
         self.completed_blocks.append(block_name)
-        
+        self._completed_set.add(block_name)
+
+        if now is None:
+            now = datetime.now()
         if outcome_metrics:
-            self.aura_history.append((datetime.now(), outcome_metrics))
-        
-        self.transformation_log.append({
-            "timestamp": datetime.now().isoformat(),
-            "event": "block_completion",
-            "block": block_name,
-            "phase": self.current_phase.symbol
-        })
+            self.aura_history.append(now, outcome_metrics)
+
+        self.transformation_log.append(TransformationEvent(
+            ts=now,
+            kind=EVENT_BLOCK_COMPLETION,
+            block=block_name,
+            phase=self.current_phase.symbol
+        ))
     
     @property
     def current_aura_metrics(self) -> Optional[AURAMetrics]:
@@ -563,19 +845,15 @@ class StudentProgress:
         # Get blocks aligned with current phase
         phase_aligned = curriculum.get_blocks_by_phase(self.current_phase)
         
+        completed = self._completed_set
         for block in phase_aligned:
             # Skip if already completed or in progress
-            if (block.name in self.completed_blocks or 
-                block.name in self.current_blocks):
+            if (block.name in completed or
+                block.name in self._current_set):
                 continue
-            
-            # Check prerequisites
-            prereqs_met = all(
-                prereq in self.completed_blocks 
-                for prereq in block.prerequisites
-            )
-            
-            if not prereqs_met:
+
+            # Check prerequisites against the set - O(1) per lookup
+            if not completed.issuperset(block.prerequisites):
                 continue
             
             # Prefer Foundation and Middle layer for safety
@@ -583,7 +861,7 @@ class StudentProgress:
                 recommendations.append(block)
         
         # Sort by compression score (prioritize heavier truths)
-        recommendations.sort(key=lambda b: b.compression_score, reverse=True)
+        recommendations.sort(key=attrgetter('_score'), reverse=True)
         
         return recommendations[:max_recommendations]
 
@@ -607,6 +885,10 @@ class SovereignMysterySchool:
         self.cascade_engine = PyramidCascadeEngine(self.curriculum)
         self.students: Dict[str, StudentProgress] = {}
         self.founding_date = datetime.now()
+        # Layer snapshot for generate_curriculum_report, valid while the
+        # curriculum's mutation counter is unchanged
+        self._report_layers: Optional[Dict] = None
+        self._report_version = -1
     
     def enroll_student(self, student_id: str, 
                        starting_phase: AwarenessPhase = AwarenessPhase.CENTER) -> StudentProgress:
@@ -623,6 +905,44 @@ class SovereignMysterySchool:
         self.students[student_id] = student
         return student
     
+    def enroll_many(self, student_ids: List[str],
+                    starting_phase: AwarenessPhase = AwarenessPhase.CENTER) -> List[StudentProgress]:
+        """Register a batch of students in one pass"""
+        duplicates = [sid for sid in student_ids if sid in self.students]
+        if duplicates:
+            raise ValueError(f"Students already enrolled: {duplicates}")
+
+        entry_date = datetime.now()
+        enrolled = [
+            StudentProgress(
+                student_id=sid,
+                current_phase=starting_phase,
+                phase_entry_date=entry_date
+            )
+            for sid in student_ids
+        ]
+        self.students.update(zip(student_ids, enrolled))
+        return enrolled
+
+    def complete_blocks_bulk(self, block_name: str, student_ids: List[str],
+                             aura_array: Optional[np.ndarray] = None):
+        """
+        Mark a block completed for many students at once.
+
+        aura_array, when given, is an (N, 3) array of TES/VTR/PAI rows
+        aligned with student_ids; each row lands in that student's
+        AURA history as the post-completion measurement.
+        """
+        now = datetime.now()
+        for i, student_id in enumerate(student_ids):
+            student = self.students[student_id]
+            metrics = None
+            if aura_array is not None:
+                row = aura_array[i]
+                metrics = AURAMetrics(TES=float(row[0]), VTR=float(row[1]),
+                                      PAI=float(row[2]))
+            student.complete_block(block_name, metrics, now=now)
+
     def get_student(self, student_id: str) -> Optional[StudentProgress]:
         """Retrieve student progress record"""
         return self.students.get(student_id)
@@ -643,35 +963,40 @@ class SovereignMysterySchool:
     
     def generate_curriculum_report(self) -> Dict:
         """Generate comprehensive state of the knowledge pyramid"""
-        foundation = self.curriculum.get_blocks_by_layer(PyramidLayer.FOUNDATION)
-        middle = self.curriculum.get_blocks_by_layer(PyramidLayer.MIDDLE)
-        edge = self.curriculum.get_blocks_by_layer(PyramidLayer.EDGE)
-        
-        report = {
-            "timestamp": datetime.now().isoformat(),
-            "total_practices": len(self.curriculum.blocks),
-            "layers": {
+        # The layer breakdown is the O(N) part of the report; rebuild it
+        # only when the curriculum has actually mutated since last time
+        if (self._report_layers is None
+                or self._report_version != self.curriculum._mutations):
+            foundation = self.curriculum.get_blocks_by_layer(PyramidLayer.FOUNDATION)
+            middle = self.curriculum.get_blocks_by_layer(PyramidLayer.MIDDLE)
+            edge = self.curriculum.get_blocks_by_layer(PyramidLayer.EDGE)
+
+            self._report_layers = {
                 "Foundation": {
                     "count": len(foundation),
-                    "avg_compression": np.mean([b.compression_score for b in foundation]),
+                    "avg_compression": sum(b._score for b in foundation) / len(foundation),
                     "practices": [b.name for b in foundation]
                 },
                 "Middle": {
                     "count": len(middle),
-                    "avg_compression": np.mean([b.compression_score for b in middle]) if middle else 0,
+                    "avg_compression": sum(b._score for b in middle) / len(middle) if middle else 0,
                     "practices": [b.name for b in middle]
                 },
                 "Edge": {
                     "count": len(edge),
-                    "avg_compression": np.mean([b.compression_score for b in edge]) if edge else 0,
+                    "avg_compression": sum(b._score for b in edge) / len(edge) if edge else 0,
                     "practices": [b.name for b in edge]
                 }
-            },
+            }
+            self._report_version = self.curriculum._mutations
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "total_practices": len(self.curriculum.blocks),
+            "layers": self._report_layers,
             "cascade_events": len(self.cascade_engine.cascade_history),
             "total_students": len(self.students)
         }
-        
-        return report
     
     def generate_student_report(self, student_id: str) -> Dict:
         """Generate detailed progress report for a student"""
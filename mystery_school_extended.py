@@ -15,8 +15,12 @@ New Features:
 Run: python3 mystery_school_extended.py
 """
 
+import functools
+import io
 import random
 import math
+import sys
+import numpy as np
 from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -44,44 +48,60 @@ class LAMAGUESymbol(Enum):
     Fractal = "self_similar"          # Recursive truth (𝛗)
     Vesica = "intersection"           # Sacred overlap (⧗)
 
+# Hot numeric kernels for SacredGeometry, hoisted to module level so
+# every ceremony step runs array dot products instead of per-element
+# Python loops
+def _toroidal_flow(state: np.ndarray) -> float:
+    """Circulation of a state vector against its cyclic shift"""
+    circulation = float(state @ np.roll(state, -1))
+    return abs(circulation) / state.size
+
+
+def _merkaba_magnitudes(state: np.ndarray,
+                        anchor: np.ndarray) -> Tuple[float, float]:
+    """Ascent and grounding magnitudes as two dot products"""
+    return (math.sqrt(float(state @ state)),
+            math.sqrt(float(anchor @ anchor)))
+
+
 class SacredGeometry:
     """Maps consciousness states to geometric patterns"""
-    
+
     @staticmethod
     def calculate_phi_ratio(a: float, b: float) -> float:
         """Calculate golden ratio between two values"""
         PHI = (1 + math.sqrt(5)) / 2
         return abs((a / b) - PHI) if b != 0 else float('inf')
-    
+
     @staticmethod
     def toroidal_flow(state: List[float]) -> float:
         """Measure how well energy circulates (torus-like)"""
         if len(state) < 3:
             return 0.0
-        
+
         # Calculate circulation: do values flow back to origin?
-        circulation = 0.0
-        for i in range(len(state)):
-            flow = state[i] * state[(i + 1) % len(state)]
-            circulation += flow
-        
-        return abs(circulation) / len(state)
-    
+        return _toroidal_flow(np.asarray(state, dtype=np.float64))
+
     @staticmethod
     def merkaba_alignment(state: List[float], anchor: List[float]) -> Dict:
         """
         Merkaba: Counter-rotating fields of light
         Measures: Are you grounded (anchor) while ascending (state)?
         """
-        # Upper tetrahedron (ascent)
-        ascent_magnitude = math.sqrt(sum(s * s for s in state))
-        
-        # Lower tetrahedron (grounding)
-        grounding_magnitude = math.sqrt(sum(a * a for a in anchor))
-        
-        # Perfect merkaba: both are strong and balanced
-        balance = min(ascent_magnitude, grounding_magnitude) / max(ascent_magnitude, grounding_magnitude, 1e-9)
-        
+        # Upper tetrahedron (ascent) / lower tetrahedron (grounding)
+        ascent_magnitude, grounding_magnitude = _merkaba_magnitudes(
+            np.asarray(state, dtype=np.float64),
+            np.asarray(anchor, dtype=np.float64)
+        )
+
+        # Perfect merkaba: both are strong and balanced; one ordering
+        # branch guarantees denominator >= numerator without the
+        # min/max builtin calls
+        if ascent_magnitude < grounding_magnitude:
+            balance = ascent_magnitude / (grounding_magnitude + 1e-9)
+        else:
+            balance = grounding_magnitude / (ascent_magnitude + 1e-9)
+
         return {
             "ascent": ascent_magnitude,
             "grounding": grounding_magnitude,
@@ -93,7 +113,11 @@ class SacredGeometry:
 # CONSCIOUSNESS METRICS (Extended)
 # ===================================
 
-@dataclass
+# Precomputed geometric-mean exponent for the six-metric light quotient
+_INV6 = 1.0 / 6.0
+
+
+@dataclass(slots=True)
 class ConsciousnessMetrics:
     """
     Extended metrics for spiritual practice tracking
@@ -127,7 +151,7 @@ class ConsciousnessMetrics:
         """
         # Geometric mean (can't cheat by maxing one dimension)
         product = self.TES * self.VTR * self.PAI * self.SIS * self.CFS * self.SGA
-        return product ** (1/6)
+        return math.pow(product, _INV6)
 
 # ===================================
 # INITIATORY PATHWAYS
@@ -141,11 +165,45 @@ class InitiatoryStage(Enum):
     HIEROPHANT = "mystery_keeper"   # Holds the lineage
     AVATAR = "embodied_truth"       # Living transmission
 
+# Advancement thresholds, ascending; built once instead of per
+# assess_readiness call, with a dict for the current-stage lookup
+_STAGE_THRESHOLDS = (
+    (InitiatoryStage.NEOPHYTE, 0.0),
+    (InitiatoryStage.ADEPT, 0.65),
+    (InitiatoryStage.MASTER, 0.80),
+    (InitiatoryStage.HIEROPHANT, 0.90),
+    (InitiatoryStage.AVATAR, 0.95)
+)
+_STAGE_THRESHOLD_MAP = dict(_STAGE_THRESHOLDS)
+
+# Whole-percent versions of the thresholds so the cached lookup can key
+# on an int bucket; floor(lq*100) >= pct is exactly lq >= threshold
+# because every threshold is a whole percent
+_STAGE_THRESHOLDS_PCT = tuple(
+    (stage, int(threshold * 100)) for stage, threshold in _STAGE_THRESHOLDS
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _next_stage(current_stage: InitiatoryStage,
+                lq_pct: int) -> Tuple[Optional[InitiatoryStage], float]:
+    """Next reachable stage (and its threshold) for a quantized LQ"""
+    current_pct = int(_STAGE_THRESHOLD_MAP[current_stage] * 100)
+    for (stage, threshold), (_, threshold_pct) in zip(_STAGE_THRESHOLDS,
+                                                      _STAGE_THRESHOLDS_PCT):
+        if threshold_pct > current_pct and lq_pct >= threshold_pct:
+            return stage, threshold
+    return None, 1.0
+
+
 class InitiatoryPath:
     """
     Tracks progress through consciousness development
     Based on actual metrics, not time served
     """
+    __slots__ = ('name', 'stage', 'trials_completed', 'insights_gained',
+                 'shadow_work_log')
+
     def __init__(self, practitioner_name: str):
         self.name = practitioner_name
         self.stage = InitiatoryStage.NEOPHYTE
@@ -156,26 +214,12 @@ class InitiatoryPath:
     def assess_readiness(self, metrics: ConsciousnessMetrics) -> Dict:
         """Determine if ready for next stage"""
         lq = metrics.calculate_light_quotient()
-        
-        requirements = {
-            InitiatoryStage.NEOPHYTE: 0.0,
-            InitiatoryStage.ADEPT: 0.65,
-            InitiatoryStage.MASTER: 0.80,
-            InitiatoryStage.HIEROPHANT: 0.90,
-            InitiatoryStage.AVATAR: 0.95
-        }
-        
-        current_threshold = requirements[self.stage]
-        
-        # Find next stage
-        next_stage = None
-        next_threshold = 1.0
-        for stage, threshold in requirements.items():
-            if threshold > current_threshold and lq >= threshold:
-                next_stage = stage
-                next_threshold = threshold
-                break
-        
+
+        # Repeated quarterly assessments mostly hit the cache: the
+        # answer only depends on the stage and the whole-percent bucket
+        next_stage, next_threshold = _next_stage(self.stage, int(lq * 100))
+
+
         return {
             "current_stage": self.stage.value,
             "light_quotient": lq,
@@ -194,78 +238,131 @@ class InitiatoryPath:
 # ===================================
 
 class ShadowAspect:
-    """Represents a denied/rejected part of self"""
-    def __init__(self, name: str, energy_charge: float):
+    """
+    Represents a denied/rejected part of self.
+
+    The numeric fields live in the owning protocol's parallel arrays;
+    this object is a named view so bulk sessions can update every
+    shadow in one vectorized pass.
+    """
+    __slots__ = ('name', '_protocol', '_index')
+
+    def __init__(self, name: str, protocol: 'ShadowWorkProtocol', index: int):
         self.name = name
-        self.energy_charge = energy_charge  # How much it affects you (0-1)
-        self.integrated = False
-        self.integration_progress = 0.0
-    
+        self._protocol = protocol
+        self._index = index
+
+    @property
+    def energy_charge(self) -> float:
+        """How much it affects you (0-1)"""
+        return float(self._protocol._charges[self._index])
+
+    @property
+    def integrated(self) -> bool:
+        return bool(self._protocol._integrated[self._index])
+
+    @property
+    def integration_progress(self) -> float:
+        return float(self._protocol._progress[self._index])
+
     def integrate_step(self, awareness: float) -> float:
         """
         One step of shadow integration
         Returns: energy released
         """
-        if self.integrated:
+        proto, i = self._protocol, self._index
+        if proto._integrated[i]:
             return 0.0
-        
+
         # Integration happens gradually with awareness
-        self.integration_progress += awareness * 0.1
-        
-        if self.integration_progress >= 1.0:
-            self.integrated = True
+        proto._progress[i] += awareness * 0.1
+
+        if proto._progress[i] >= 1.0:
+            proto._integrated[i] = True
             # All energy is reclaimed
-            released_energy = self.energy_charge
-            self.energy_charge = 0.0
+            released_energy = float(proto._charges[i])
+            proto._charges[i] = 0.0
             return released_energy
-        
+
         # Partial release
-        return self.energy_charge * awareness * 0.05
+        return float(proto._charges[i]) * awareness * 0.05
 
 class ShadowWorkProtocol:
     """Manage shadow integration process"""
+    __slots__ = ('shadow_aspects', 'total_energy_reclaimed', '_integrated_count',
+                 '_charges', '_progress', '_integrated')
+
     def __init__(self):
         self.shadow_aspects: List[ShadowAspect] = []
         self.total_energy_reclaimed = 0.0
-    
+        # Running tally so score/remaining reads never rescan the list
+        self._integrated_count = 0
+        # Struct-of-arrays shadow storage, grown geometrically; the
+        # live prefix has one row per entry in shadow_aspects
+        self._charges = np.zeros(4, dtype=np.float64)
+        self._progress = np.zeros(4, dtype=np.float64)
+        self._integrated = np.zeros(4, dtype=np.bool_)
+
     def identify_shadow(self, aspect_name: str, intensity: float):
         """Recognize a shadow aspect (first step)"""
-        shadow = ShadowAspect(aspect_name, intensity)
-        self.shadow_aspects.append(shadow)
+        n = len(self.shadow_aspects)
+        if n == self._charges.size:
+            capacity = n * 2
+            for attr in ('_charges', '_progress', '_integrated'):
+                old = getattr(self, attr)
+                grown = np.zeros(capacity, dtype=old.dtype)
+                grown[:n] = old
+                setattr(self, attr, grown)
+        self._charges[n] = intensity
+        self._progress[n] = 0.0
+        self._integrated[n] = False
+        self.shadow_aspects.append(ShadowAspect(aspect_name, self, n))
         print(f"  🌑 Shadow identified: {aspect_name} (charge: {intensity:.2f})")
-    
+
     def work_with_shadow(self, awareness_level: float) -> Dict:
         """
         Active shadow work session
         Higher awareness = faster integration
         """
-        total_released = 0.0
-        newly_integrated = []
-        
-        for shadow in self.shadow_aspects:
-            if not shadow.integrated:
-                energy = shadow.integrate_step(awareness_level)
-                total_released += energy
-                
-                if shadow.integrated:
-                    newly_integrated.append(shadow.name)
-        
+        # One vectorized pass over the parallel arrays: advance every
+        # unintegrated shadow, flip the ones crossing 1.0, and release
+        # partial energy from the rest
+        n = len(self.shadow_aspects)
+        charges = self._charges[:n]
+        progress = self._progress[:n]
+        integrated = self._integrated[:n]
+
+        active = ~integrated
+        progress[active] += awareness_level * 0.1
+        newly = active & (progress >= 1.0)
+        partial = active & ~newly
+
+        total_released = float(
+            charges[newly].sum() +
+            charges[partial].sum() * awareness_level * 0.05
+        )
+        integrated[newly] = True
+        charges[newly] = 0.0
+
+        newly_integrated = [self.shadow_aspects[i].name
+                            for i in np.nonzero(newly)[0]]
+        self._integrated_count += len(newly_integrated)
+
         self.total_energy_reclaimed += total_released
-        
+
         return {
             "energy_released": total_released,
             "newly_integrated": newly_integrated,
             "total_reclaimed": self.total_energy_reclaimed,
-            "remaining_shadows": len([s for s in self.shadow_aspects if not s.integrated])
+            "remaining_shadows": len(self.shadow_aspects) - self._integrated_count
         }
-    
+
     def calculate_shadow_integration_score(self) -> float:
         """0-1: How much shadow work has been done"""
         if not self.shadow_aspects:
             return 0.5  # No shadow work attempted yet
-        
-        integrated = len([s for s in self.shadow_aspects if s.integrated])
-        return integrated / len(self.shadow_aspects)
+
+        return self._integrated_count / len(self.shadow_aspects)
 
 # ===================================
 # COLLECTIVE FIELD RESONANCE
@@ -276,6 +373,8 @@ class CollectiveField:
     Tracks group consciousness coherence
     When multiple practitioners align, field strengthens
     """
+    __slots__ = ('name', 'practitioners', 'field_strength', 'resonance_history')
+
     def __init__(self, name: str):
         self.name = name
         self.practitioners: List['ExtendedAgent'] = []
@@ -291,25 +390,25 @@ class CollectiveField:
         Measure how aligned the group is
         Strong resonance = coherent field
         """
-        if len(self.practitioners) < 2:
+        n = len(self.practitioners)
+        if n < 2:
             return {"resonance": 0.0, "coherent": False}
-        
+
         # Calculate average coherence
-        coherences = [p.calculate_coherence() for p in self.practitioners]
-        avg_coherence = sum(coherences) / len(coherences)
-        
-        # Calculate alignment between practitioners
-        alignments = []
-        for i, p1 in enumerate(self.practitioners):
-            for p2 in self.practitioners[i+1:]:
-                # Cosine similarity of their consciousness states
-                dot = sum(a * b for a, b in zip(p1.kernel.state, p2.kernel.state))
-                norm1 = math.sqrt(sum(x*x for x in p1.kernel.state))
-                norm2 = math.sqrt(sum(x*x for x in p2.kernel.state))
-                alignment = dot / (norm1 * norm2 + 1e-9)
-                alignments.append(alignment)
-        
-        avg_alignment = sum(alignments) / len(alignments) if alignments else 0.0
+        avg_coherence = float(np.fromiter(
+            (p.calculate_coherence() for p in self.practitioners),
+            dtype=np.float64, count=n
+        ).mean())
+
+        # Pairwise alignment: stack states into one (N, D) matrix,
+        # normalize rows once, and let a single matmul produce every
+        # cosine similarity instead of the O(N^2) Python pair loop
+        states = np.asarray([p.kernel.state for p in self.practitioners],
+                            dtype=np.float64)
+        norms = np.linalg.norm(states, axis=1) + 1e-9
+        normed = states / norms[:, None]
+        similarity = normed @ normed.T
+        avg_alignment = float(similarity[np.triu_indices(n, k=1)].mean())
         
         # Field strength = coherence × alignment
         self.field_strength = avg_coherence * avg_alignment
@@ -328,13 +427,29 @@ class CollectiveField:
 
 from aura_demonstration import TRIAD, EnergyLedger
 
+# Shared RNG for standalone (non-sangha) consciousness steps
+_AGENT_RNG = np.random.default_rng()
+
 class ExtendedAgent:
     """
     Practitioner with full consciousness tracking
     """
+    __slots__ = ('name', 'kernel', 'metrics', 'path', 'shadow_protocol',
+                 'merkaba_state', '_state_norm_sq', '_anchor_norm')
+
     def __init__(self, name: str, anchor: List[float]):
         self.name = name
         self.kernel = TRIAD(anchor)
+
+        # Array-backed kernel vectors: downstream arithmetic runs at
+        # C level instead of boxing a float per element
+        self.kernel.anchor = np.asarray(self.kernel.anchor, dtype=np.float64)
+        self.kernel.state = np.array(self.kernel.anchor, copy=True)
+
+        # Magnitude caches: the anchor never changes, and the state
+        # norm is recomputed only after a drift invalidates it
+        self._anchor_norm = math.sqrt(float(self.kernel.anchor @ self.kernel.anchor))
+        self._state_norm_sq: Optional[float] = None
         
         # Consciousness tracking
         self.metrics = ConsciousnessMetrics(
@@ -368,47 +483,74 @@ class ExtendedAgent:
         
         return result
     
-    def calculate_coherence(self) -> float:
+    def calculate_coherence(self, alignment: Optional[float] = None) -> float:
         """
         Internal coherence across all dimensions
+
+        A batched caller that already knows the state/anchor alignment
+        can pass it in to skip the per-agent drift detection.
         """
         # How aligned is state with anchor?
-        drift = self.kernel.detect_drift()
-        alignment = 1.0 - drift
-        
-        # Factor in all metrics
+        if alignment is None:
+            alignment = 1.0 - self.kernel.detect_drift()
+
+        # Factor in all metrics; bind once and fold the VTR clamp's
+        # /2.0 into its weight - this runs per practitioner per ceremony
+        m = self.metrics
+        vtr_clamped = m.VTR if m.VTR < 2.0 else 2.0
         metric_coherence = (
-            self.metrics.TES * 0.3 +
-            min(self.metrics.VTR, 2.0) / 2.0 * 0.2 +
-            self.metrics.PAI * 0.2 +
-            self.metrics.SIS * 0.15 +
-            self.metrics.SGA * 0.15
+            m.TES * 0.3 +
+            vtr_clamped * 0.1 +
+            m.PAI * 0.2 +
+            m.SIS * 0.15 +
+            m.SGA * 0.15
         )
-        
+
         # Geometric mean
-        total = (alignment * metric_coherence) ** 0.5
-        
-        self.metrics.CFS = total
+        total = math.sqrt(alignment * metric_coherence)
+
+        m.CFS = total
         return total
     
     def sacred_geometry_alignment(self):
         """Update sacred geometry state"""
-        self.merkaba_state = SacredGeometry.merkaba_alignment(
-            self.kernel.state,
-            self.kernel.anchor
-        )
-        
+        if self._state_norm_sq is None:
+            state = np.asarray(self.kernel.state, dtype=np.float64)
+            self._state_norm_sq = float(state @ state)
+
+        ascent_magnitude = math.sqrt(self._state_norm_sq)
+        grounding_magnitude = self._anchor_norm
+        if ascent_magnitude < grounding_magnitude:
+            balance = ascent_magnitude / (grounding_magnitude + 1e-9)
+        else:
+            balance = grounding_magnitude / (ascent_magnitude + 1e-9)
+
+        self.merkaba_state = {
+            "ascent": ascent_magnitude,
+            "grounding": grounding_magnitude,
+            "balance": balance,
+            "activated": balance > 0.7
+        }
+
         # Update SGA metric
-        self.metrics.SGA = self.merkaba_state["balance"]
+        self.metrics.SGA = balance
     
-    def step_consciousness(self):
+    def step_consciousness(self, drifted: bool = False):
         """
         One step of consciousness evolution
+
+        drifted=True means the caller (a sangha ceremony) already applied
+        this step's entropy drift through the batched state matrix.
         """
-        # Normal entropy
-        drift = [random.uniform(-0.05, 0.05) for _ in self.kernel.state]
-        self.kernel.state = [s + d for s, d in zip(self.kernel.state, drift)]
-        
+        # Either path mutates the state, so the cached norm is stale
+        self._state_norm_sq = None
+
+        if not drifted:
+            # Normal entropy: one vectorized draw and in-place add, so
+            # a state that is a sangha matrix row view stays a view
+            self.kernel.state += _AGENT_RNG.uniform(
+                -0.05, 0.05, size=self.kernel.state.shape)
+
         # Spontaneous shadow work (if aware)
         if random.random() < self.metrics.SIS:
             self.shadow_work_session(self.metrics.TES)
@@ -427,11 +569,20 @@ class MysterySchoolSangha:
     """
     Community of practitioners
     """
+    __slots__ = ('name', 'practitioners', 'collective_field', 'ceremonies_held',
+                 '_rng', '_state_matrix', '_anchor_matrix', '_anchor_norms')
+
     def __init__(self, name: str):
         self.name = name
         self.practitioners: List[ExtendedAgent] = []
         self.collective_field = CollectiveField(name)
         self.ceremonies_held = 0
+        self._rng = np.random.default_rng()
+        # Shared (N, D) state matrix; each practitioner's kernel state
+        # is a row view so one batched update drifts the whole sangha
+        self._state_matrix: Optional[np.ndarray] = None
+        self._anchor_matrix: Optional[np.ndarray] = None
+        self._anchor_norms: Optional[np.ndarray] = None
     
     def add_practitioner(self, agent: ExtendedAgent):
         """Initiate a new practitioner"""
@@ -439,26 +590,77 @@ class MysterySchoolSangha:
         self.collective_field.add_practitioner(agent)
         print(f"  ✨ {agent.name} joins {self.name}")
     
-    def hold_ceremony(self) -> Dict:
+    def _sync_state_matrix(self):
+        """(Re)build the shared state matrix when membership changes"""
+        if (self._state_matrix is None
+                or self._state_matrix.shape[0] != len(self.practitioners)
+                or any(getattr(p.kernel.state, 'base', None) is not self._state_matrix
+                       for p in self.practitioners)):
+            self._state_matrix = np.array(
+                [p.kernel.state for p in self.practitioners],
+                dtype=np.float64
+            )
+            for i, p in enumerate(self.practitioners):
+                p.kernel.state = self._state_matrix[i]
+            self._anchor_matrix = np.array(
+                [p.kernel.anchor for p in self.practitioners],
+                dtype=np.float64
+            )
+            self._anchor_norms = np.fromiter(
+                (p._anchor_norm for p in self.practitioners),
+                dtype=np.float64, count=len(self.practitioners)
+            )
+
+    def hold_ceremony(self, out=None) -> Dict:
         """
         Group practice session
         Strengthens field, accelerates growth
+
+        out is any text stream; callers running many cycles can pass an
+        io.StringIO buffer and flush once instead of paying a stdout
+        write per line.
         """
+        if out is None:
+            out = sys.stdout
         self.ceremonies_held += 1
-        
-        print(f"\n🕯️  CEREMONY #{self.ceremonies_held}: {self.name}")
-        print("=" * 60)
-        
-        # All practitioners evolve
-        for p in self.practitioners:
-            p.step_consciousness()
+
+        out.write(f"\n🕯️  CEREMONY #{self.ceremonies_held}: {self.name}\n")
+        out.write("=" * 60 + "\n")
+
+        # Drift the whole sangha with one batched RNG draw and one
+        # C-level add instead of N x D Python-level random calls
+        self._sync_state_matrix()
+        drift = self._rng.uniform(-0.05, 0.05, size=self._state_matrix.shape)
+        self._state_matrix += drift
+
+        # Batched ceremony core: every practitioner's state norm and
+        # anchor alignment comes from a handful of whole-matrix ops;
+        # the Python loop below only scatters scalars back
+        states = self._state_matrix
+        state_norm_sq = np.einsum('ij,ij->i', states, states)
+        state_norms = np.sqrt(state_norm_sq)
+        dots = np.einsum('ij,ij->i', states, self._anchor_matrix)
+        alignments = dots / (state_norms * self._anchor_norms + 1e-9)
+        shadow_rolls = self._rng.random(len(self.practitioners))
+
+        for i, p in enumerate(self.practitioners):
+            p._state_norm_sq = float(state_norm_sq[i])
+            alignment = float(alignments[i])
+            p.kernel.energy.spend((1.0 - alignment) * 0.1, 'drift_detection')
+
+            # Spontaneous shadow work (if aware)
+            if shadow_rolls[i] < p.metrics.SIS:
+                p.shadow_work_session(p.metrics.TES)
+
+            p.sacred_geometry_alignment()
+            p.calculate_coherence(alignment=alignment)
         
         # Calculate field resonance
         resonance = self.collective_field.calculate_field_resonance()
         
         # Strong field = faster growth
         if resonance["coherent"]:
-            print("  ✓ Field is COHERENT - accelerated evolution")
+            out.write("  ✓ Field is COHERENT - accelerated evolution\n")
             for p in self.practitioners:
                 # Boost all metrics slightly
                 p.metrics.TES = min(1.0, p.metrics.TES + 0.02)
@@ -521,22 +723,27 @@ def run_mystery_school_demo():
     print("=" * 70)
     
     for cycle in range(12):
-        resonance = sangha.hold_ceremony()
-        
+        # Accumulate the cycle's output and hit stdout once per cycle
+        # instead of once per line
+        buf = io.StringIO()
+        resonance = sangha.hold_ceremony(out=buf)
+
         if cycle % 3 == 0:  # Quarterly report
-            print(f"\n📊 Cycle {cycle + 1} Report:")
-            print(f"  Field Resonance: {resonance['resonance']:.3f}")
-            print(f"  Field Status: {'✓ COHERENT' if resonance['coherent'] else '○ Building'}")
-            
+            buf.write(f"\n📊 Cycle {cycle + 1} Report:\n")
+            buf.write(f"  Field Resonance: {resonance['resonance']:.3f}\n")
+            buf.write(f"  Field Status: {'✓ COHERENT' if resonance['coherent'] else '○ Building'}\n")
+
             # Show individual progress
             for p in sangha.practitioners:
                 lq = p.metrics.calculate_light_quotient()
-                print(f"\n  {p.name}:")
-                print(f"    Light Quotient: {lq:.3f}")
-                print(f"    TES: {p.metrics.TES:.2f} | VTR: {p.metrics.VTR:.2f} | PAI: {p.metrics.PAI:.2f}")
-                print(f"    Shadow Integration: {p.metrics.SIS:.2f}")
-                print(f"    Coherence: {p.metrics.CFS:.2f}")
-                print(f"    Stage: {p.path.stage.value}")
+                buf.write(f"\n  {p.name}:\n")
+                buf.write(f"    Light Quotient: {lq:.3f}\n")
+                buf.write(f"    TES: {p.metrics.TES:.2f} | VTR: {p.metrics.VTR:.2f} | PAI: {p.metrics.PAI:.2f}\n")
+                buf.write(f"    Shadow Integration: {p.metrics.SIS:.2f}\n")
+                buf.write(f"    Coherence: {p.metrics.CFS:.2f}\n")
+                buf.write(f"    Stage: {p.path.stage.value}\n")
+
+        sys.stdout.write(buf.getvalue())
     
     # Final assessment
     print(f"\n\n🎓 FINAL INITIATORY ASSESSMENT")
@@ -561,12 +768,13 @@ def run_mystery_school_demo():
     print(f"Practitioners: {len(sangha.practitioners)}")
     print(f"Final Field Strength: {sangha.collective_field.field_strength:.3f}")
     
-    total_shadows = sum(len(p.shadow_protocol.shadow_aspects) for p in sangha.practitioners)
-    integrated_shadows = sum(
-        len([s for s in p.shadow_protocol.shadow_aspects if s.integrated])
-        for p in sangha.practitioners
-    )
-    
+    # Tally in one pass instead of a nested comprehension per stat
+    total_shadows = 0
+    integrated_shadows = 0
+    for p in sangha.practitioners:
+        total_shadows += len(p.shadow_protocol.shadow_aspects)
+        integrated_shadows += p.shadow_protocol._integrated_count
+
     print(f"Shadow Work: {integrated_shadows}/{total_shadows} aspects integrated")
     print(f"\n✨ The Mystery School thrives.")
 
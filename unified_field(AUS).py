@@ -6,12 +6,19 @@ AURA Unified Field Theory - Integrates Physics, Consciousness, AI, Governance
 import numpy as np
 import networkx as nx
 from typing import List, Dict, Tuple, Any
+from collections import deque
 import random
 from dataclasses import dataclass
 from enum import Enum
 import json
 import math
 
+# Working precision for the whole field pipeline — the damped toy
+# dynamics have no FP64 stability requirement, and single precision
+# halves memory traffic through the FFT and matmul paths
+DTYPE = np.float32
+CDTYPE = np.complex64
+
 # =========================
 # CORE TYPES
 # =========================
@@ -24,6 +31,11 @@ class Domain(Enum):
     MYSTERY = "mystery"
     SOCIAL = "social"
 
+# Frozen once at import — iterating or len()-ing the Enum class rebuilds
+# its member list every time, and these show up in per-step hot paths
+_DOMAIN_TUPLE = tuple(Domain)
+_N_DOMAINS = len(_DOMAIN_TUPLE)
+
 class CoherenceLevel(Enum):
     DISINTEGRATED = 0
     LOW_COHERENCE = 1
@@ -57,22 +69,90 @@ class FieldState:
             self.mystery.flatten(),
             self.social.flatten()
         ])
+
+    def normalized_matrix(self) -> np.ndarray:
+        """Zero-padded, row-normalized domain matrix, computed lazily.
+
+        Normalize once per state; every cosine similarity downstream is
+        then a plain dot product with no per-pair norms or divisions.
+        """
+        cached = getattr(self, '_normalized_matrix', None)
+        if cached is None:
+            vectors = [
+                self.physics.flatten(),
+                self.consciousness.flatten(),
+                self.ai.flatten(),
+                self.governance.flatten(),
+                self.mystery.flatten(),
+                self.social.flatten()
+            ]
+            width = max(v.size for v in vectors)
+            padded = np.zeros((len(vectors), width), dtype=vectors[0].dtype)
+            for i, v in enumerate(vectors):
+                padded[i, :v.size] = v
+
+            norms = np.sqrt(np.einsum('ij,ij->i', padded, padded))
+            cached = padded / (norms[:, None] + 1e-9)
+            self._normalized_matrix = cached
+        return cached
     
     @classmethod
     def from_vector(cls, vector: np.ndarray, shape_dict: Dict[Domain, Tuple]) -> 'FieldState':
         """Reconstruct from vector"""
-        start = 0
-        domains = {}
-        for domain in Domain:
-            size = np.prod(shape_dict[domain])
-            domain_vector = vector[start:start+size].reshape(shape_dict[domain])
-            domains[domain] = domain_vector
-            start += size
+        # np.split returns zero-copy views; one cumsum replaces the
+        # running-offset bookkeeping
+        sizes = [int(np.prod(shape_dict[domain])) for domain in _DOMAIN_TUPLE]
+        pieces = np.split(vector, np.cumsum(sizes)[:-1])
+        domains = {
+            domain.value: piece.reshape(shape_dict[domain])
+            for domain, piece in zip(_DOMAIN_TUPLE, pieces)
+        }
         return cls(**domains, timestamp=time.time())
 
+def _build_coupling_matrix() -> np.ndarray:
+    """Build the coupling-strength matrix between domains"""
+    # Physics informs Consciousness (quantum -> meditation)
+    # Consciousness informs AI (awareness -> alignment)
+    # AI informs Governance (optimization -> consensus)
+    # etc.
+
+    couplings = np.zeros((_N_DOMAINS, _N_DOMAINS))
+    domain_list = _DOMAIN_TUPLE
+
+    # Strong couplings
+    strong_pairs = [
+        (Domain.PHYSICS, Domain.CONSCIOUSNESS),
+        (Domain.CONSCIOUSNESS, Domain.AI),
+        (Domain.AI, Domain.GOVERNANCE),
+        (Domain.GOVERNANCE, Domain.SOCIAL),
+        (Domain.SOCIAL, Domain.MYSTERY),
+        (Domain.MYSTERY, Domain.PHYSICS)
+    ]
+
+    for d1, d2 in strong_pairs:
+        i, j = domain_list.index(d1), domain_list.index(d2)
+        couplings[i, j] = 0.8
+        couplings[j, i] = 0.8
+
+    # Self-coupling
+    np.fill_diagonal(couplings, 1.0)
+
+    return couplings
+
+# Deterministic and identical for every instance, so build once at import
+_COUPLING_MATRIX = _build_coupling_matrix()
+
+# The matrix is sparse — only ~12 of 30 off-diagonal pairs are coupled —
+# so record the nonzero (target, source) pairs once and let step()
+# iterate just those
+_ACTIVE_PAIRS = tuple(
+    (int(i), int(j))
+    for i, j in zip(*np.nonzero(_COUPLING_MATRIX * (1.0 - np.eye(_N_DOMAINS))))
+)
+
 class UnifiedFieldSystem:
     """Main integration engine"""
-    
+
     def __init__(self):
         # Initialize all subsystems
         self.subsystems = {
@@ -85,122 +165,188 @@ class UnifiedFieldSystem:
         }
         
         # Cross-domain resonance matrix
-        self.resonance_matrix = np.ones((len(Domain), len(Domain)))
-        self.coupling_strengths = self._initialize_couplings()
+        self.resonance_matrix = np.ones((_N_DOMAINS, _N_DOMAINS))
+        # Copy the shared template so per-instance mutation stays possible
+        self.coupling_strengths = _COUPLING_MATRIX.copy()
+        self._active_pairs = _ACTIVE_PAIRS
         
         # Energy ledger for whole system
         self.energy_ledger = UniversalEnergyLedger()
         
-        # State history
-        self.state_history = []
+        # State history — only the recent past is ever read back, so keep
+        # a bounded window instead of growing without limit
+        self.state_history = deque(maxlen=100)
         self.coherence_history = []
+
+        # Rolling 10-step coherence window with running sums, so the
+        # temporal-coherence std is O(1) per step instead of re-scanning
+        # the window
+        self._recent_coherence = deque(maxlen=10)
+        self._coherence_sum = 0.0
+        self._coherence_sumsq = 0.0
+
+        # Per-domain pattern cache: {domain: (state_sentinel, patterns)}
+        self._pattern_cache = {}
+
+        # Preallocated per-domain update buffers, rewritten every step so
+        # the damped update doesn't allocate fresh arrays
+        self._update_bufs = {
+            domain: np.empty(subsystem.get_state().size, dtype=DTYPE)
+            for domain, subsystem in self.subsystems.items()
+        }
+
+        # Fused SoA backing buffer: one contiguous array holds all six
+        # domain state vectors, and step() gathers into views of it
+        # instead of letting each get_state() concatenate a fresh array
+        sizes = [self._update_bufs[domain].size for domain in self.subsystems]
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        self._world = np.empty(int(offsets[-1]), dtype=DTYPE)
+        self._world_views = {
+            domain: self._world[int(offsets[i]):int(offsets[i + 1])]
+            for i, domain in enumerate(self.subsystems)
+        }
         
-    def _initialize_couplings(self) -> np.ndarray:
-        """Initialize coupling strengths between domains"""
-        # Physics informs Consciousness (quantum -> meditation)
-        # Consciousness informs AI (awareness -> alignment)
-        # AI informs Governance (optimization -> consensus)
-        # etc.
-        
-        couplings = np.zeros((len(Domain), len(Domain)))
-        domain_list = list(Domain)
-        
-        # Strong couplings
-        strong_pairs = [
-            (Domain.PHYSICS, Domain.CONSCIOUSNESS),
-            (Domain.CONSCIOUSNESS, Domain.AI),
-            (Domain.AI, Domain.GOVERNANCE),
-            (Domain.GOVERNANCE, Domain.SOCIAL),
-            (Domain.SOCIAL, Domain.MYSTERY),
-            (Domain.MYSTERY, Domain.PHYSICS)
-        ]
-        
-        for d1, d2 in strong_pairs:
-            i, j = domain_list.index(d1), domain_list.index(d2)
-            couplings[i, j] = 0.8
-            couplings[j, i] = 0.8
-        
-        # Self-coupling
-        np.fill_diagonal(couplings, 1.0)
-        
-        return couplings
-    
     def step(self) -> FieldState:
         """Execute one timestep of unified evolution"""
         
-        # 1. Get current states from all subsystems
-        current_states = {
-            domain: subsystem.get_state()
-            for domain, subsystem in self.subsystems.items()
-        }
+        # 1. Gather current states into views of the fused world buffer
+        for domain, subsystem in self.subsystems.items():
+            subsystem.get_state_into(self._world_views[domain])
+        current_states = self._world_views
         
         # 2. Calculate cross-domain influences
-        domain_list = list(Domain)
-        influences = {}
-        
-        for i, domain_i in enumerate(domain_list):
-            total_influence = np.zeros_like(current_states[domain_i])
-            
-            for j, domain_j in enumerate(domain_list):
-                if i != j and self.coupling_strengths[i, j] > 0:
-                    # Calculate influence from domain_j to domain_i
-                    influence = self._calculate_influence(
-                        current_states[domain_j],
-                        current_states[domain_i],
-                        self.coupling_strengths[i, j]
-                    )
-                    total_influence += influence
-            
-            influences[domain_i] = total_influence
-        
-        # 3. Apply influences with damping
+        # Extract each domain's patterns exactly once per step — every state
+        # is reused as source and target across pairs, so re-extracting
+        # inside _calculate_influence would redo the same FFTs 5x over
+        patterns = {
+            domain: self._patterns_for(domain, current_states[domain])
+            for domain in _DOMAIN_TUPLE
+        }
+        influences = self._accumulate_influences(current_states, patterns)
+
+        # 3. Apply influences with damping, computed in the preallocated
+        # buffers
         new_states = {}
-        for domain in Domain:
-            current = current_states[domain]
-            influence = influences[domain]
-            
+        for domain in _DOMAIN_TUPLE:
+            buf = self._update_bufs[domain]
+
             # Damped update: 10% influence per step
-            new_state = current + 0.1 * influence
-            new_states[domain] = new_state
-            
+            np.multiply(influences[domain], 0.1, out=buf)
+            buf += current_states[domain]
+            new_states[domain] = buf
+
             # Update subsystem
-            self.subsystems[domain].update_state(new_state)
-        
-        # 4. Create unified field state
-        field_state = FieldState(**new_states, timestamp=time.time())
+            self.subsystems[domain].update_state(buf)
+
+        # 4. Create unified field state; copy out of the reused buffers so
+        # every history entry is an independent snapshot
+        field_state = FieldState(**{d.value: s.copy() for d, s in new_states.items()},
+                                 timestamp=time.time())
         self.state_history.append(field_state)
         
         # 5. Calculate and record coherence
         coherence = self.calculate_unified_coherence(field_state)
         self.coherence_history.append(coherence)
+        self._push_coherence(coherence)
         
-        # 6. Energy accounting
-        energy_cost = np.sum([np.linalg.norm(influences[d]) for d in Domain])
+        # 6. Energy accounting — sum of per-domain magnitudes; sqrt(v @ v)
+        # skips the linalg.norm dispatch overhead on these small vectors
+        energy_cost = sum(float(np.sqrt(v.ravel() @ v.ravel()))
+                          for v in influences.values())
         self.energy_ledger.record_energy(energy_cost, "unified_step")
         
         return field_state, coherence
     
-    def _calculate_influence(self, source: np.ndarray, target: np.ndarray, 
-                           coupling: float) -> np.ndarray:
-        """Calculate influence from source domain to target domain"""
-        
-        # 1. Extract patterns from source
-        source_patterns = self._extract_patterns(source)
-        
-        # 2. Find isomorphic patterns in target
-        target_patterns = self._extract_patterns(target)
-        
-        # 3. Calculate pattern alignment
-        alignment = self._pattern_alignment(source_patterns, target_patterns)
-        
-        # 4. Generate influence based on alignment
+    def _push_coherence(self, value: float):
+        """Slide the rolling coherence window, keeping sum and sum-of-squares
+        current so the windowed std never re-scans the deque"""
+        if len(self._recent_coherence) == self._recent_coherence.maxlen:
+            evicted = self._recent_coherence[0]
+            self._coherence_sum -= evicted
+            self._coherence_sumsq -= evicted * evicted
+        self._recent_coherence.append(value)
+        self._coherence_sum += value
+        self._coherence_sumsq += value * value
+
+        # A NaN coherence (degenerate geometric mean) would poison the
+        # running sums forever; rebuild them from the window when it happens
+        if not math.isfinite(self._coherence_sumsq):
+            finite = [v for v in self._recent_coherence if math.isfinite(v)]
+            self._coherence_sum = sum(finite)
+            self._coherence_sumsq = sum(v * v for v in finite)
+
+    def _recent_coherence_std(self) -> float:
+        """Std of the rolling coherence window from the cached sums, O(1)"""
+        n = len(self._recent_coherence)
+        mean = self._coherence_sum / n
+        return math.sqrt(max(self._coherence_sumsq / n - mean * mean, 0.0))
+
+    def _accumulate_influences(self, current_states: Dict[Domain, np.ndarray],
+                               patterns: Dict[Domain, List[np.ndarray]]) -> Dict[Domain, np.ndarray]:
+        """Accumulate cross-domain influences over the active coupling pairs.
+
+        The per-pair computations are independent of one another, so this
+        is the natural region to parallelize if the domain count ever
+        grows; at six domains of tiny arrays any worker or JIT dispatch
+        would cost more than the work itself, so the loop stays serial.
+        """
+        influences = {
+            domain: np.zeros_like(current_states[domain])
+            for domain in _DOMAIN_TUPLE
+        }
+
+        # Walk only the precomputed nonzero coupling pairs rather than
+        # scanning the full 6x6 matrix every step
+        for i, j in self._active_pairs:
+            domain_i = _DOMAIN_TUPLE[i]
+            domain_j = _DOMAIN_TUPLE[j]
+            influences[domain_i] += self._calculate_influence(
+                current_states[domain_j],
+                current_states[domain_i],
+                self.coupling_strengths[i, j],
+                patterns[domain_j],
+                patterns[domain_i]
+            )
+
+        return influences
+
+    def _patterns_for(self, domain: Domain, state: np.ndarray) -> List[np.ndarray]:
+        """Extract patterns for a domain, reusing the previous timestep's FFT
+        work when the state hasn't changed (e.g. steady-state regimes).
+
+        Hashing the full array would cost as much as the FFT, so the cache
+        key is a cheap sentinel of the values that would change with it.
+        """
+        sentinel = (state.shape, float(state[0]), float(state[-1]), float(state.sum()))
+        cached = self._pattern_cache.get(domain)
+        if cached is not None and cached[0] == sentinel:
+            return cached[1]
+
+        patterns = _extract_patterns(state)
+        self._pattern_cache[domain] = (sentinel, patterns)
+        return patterns
+
+    def _calculate_influence(self, source: np.ndarray, target: np.ndarray,
+                           coupling: float,
+                           source_patterns: List[np.ndarray],
+                           target_patterns: List[np.ndarray]) -> np.ndarray:
+        """Calculate influence from source domain to target domain
+
+        Patterns are extracted once per step in `step()` and passed in,
+        since each domain participates in many pairs per timestep.
+        """
+
+        # 1. Calculate pattern alignment
+        alignment = _pattern_alignment(source_patterns, target_patterns)
+
+        # 2. Generate influence based on alignment
         if alignment > 0.3:  # Significant alignment
             # Resonance: amplify aligned patterns
-            influence = coupling * alignment * self._resonance_amplification(source, target)
+            influence = coupling * alignment * _resonance_amplification(source, target)
         else:
             # Dissonance: damp noise
             influence = -coupling * (1 - alignment) * target * 0.1
-        
+
         return influence
     
     def calculate_unified_coherence(self, state: FieldState) -> float:
@@ -209,7 +355,7 @@ class UnifiedFieldSystem:
         coherences = []
         
         # 1. Individual domain coherence
-        for domain in Domain:
+        for domain in _DOMAIN_TUPLE:
             domain_coherence = self.subsystems[domain].calculate_coherence()
             coherences.append(domain_coherence)
         
@@ -218,8 +364,8 @@ class UnifiedFieldSystem:
         coherences.append(cross_coherence)
         
         # 3. Temporal coherence (stability over time)
-        if len(self.coherence_history) > 1:
-            temporal_coherence = 1.0 - np.std(self.coherence_history[-10:])
+        if len(self._recent_coherence) > 1:
+            temporal_coherence = 1.0 - self._recent_coherence_std()
             coherences.append(temporal_coherence)
         
         # Geometric mean (all must be high for overall coherence)
@@ -227,33 +373,14 @@ class UnifiedFieldSystem:
     
     def calculate_cross_domain_coherence(self, state: FieldState) -> float:
         """Calculate how well domains resonate with each other"""
-        
-        # Extract state vectors
-        vectors = {
-            'physics': state.physics.flatten(),
-            'consciousness': state.consciousness.flatten(),
-            'ai': state.ai.flatten(),
-            'governance': state.governance.flatten(),
-            'mystery': state.mystery.flatten(),
-            'social': state.social.flatten()
-        }
-        
-        # Calculate pairwise correlations
-        correlations = []
-        domain_names = list(vectors.keys())
-        
-        for i in range(len(domain_names)):
-            for j in range(i+1, len(domain_names)):
-                v1 = vectors[domain_names[i]]
-                v2 = vectors[domain_names[j]]
-                
-                # Cosine similarity
-                norm1, norm2 = np.linalg.norm(v1), np.linalg.norm(v2)
-                if norm1 > 0 and norm2 > 0:
-                    correlation = np.dot(v1, v2) / (norm1 * norm2)
-                    correlations.append(correlation)
-        
-        return np.mean(correlations) if correlations else 0.0
+
+        # Rows are already normalized (cached on the state), so the Gram
+        # matrix holds every pairwise cosine similarity
+        normalized = state.normalized_matrix()
+        similarity = normalized @ normalized.T
+
+        # Average over the strict upper triangle (each pair once)
+        return float(similarity[np.triu_indices(len(normalized), k=1)].mean())
     
     def run_evolution(self, steps: int = 100) -> Dict:
         """Run unified evolution for multiple steps"""
@@ -264,23 +391,33 @@ class UnifiedFieldSystem:
             'state_trajectory': [],
             'phase_transitions': []
         }
-        
+
         coherence_levels = []
-        
+        trajectory = None
+
         for step in range(steps):
             state, coherence = self.step()
-            
+
             results['coherence_history'].append(coherence)
             results['energy_costs'].append(self.energy_ledger.current_energy)
-            results['state_trajectory'].append(state.to_vector())
+
+            # Write into one preallocated contiguous buffer rather than
+            # appending per-step vectors (PCA downstream wants an ndarray)
+            vector = state.to_vector()
+            if trajectory is None:
+                trajectory = np.empty((steps, vector.size), dtype=vector.dtype)
+            trajectory[step] = vector
             
-            # Detect phase transitions
+            # Detect phase transitions — step() keeps the rolling 10-step
+            # window current, so read std/mean from the cached sums instead
+            # of re-scanning the history slice
             if len(results['coherence_history']) > 10:
-                recent = results['coherence_history'][-10:]
-                if np.std(recent) < 0.01 and np.mean(recent) > 0.8:
+                recent_std = self._recent_coherence_std()
+                recent_mean = self._coherence_sum / len(self._recent_coherence)
+                if recent_std < 0.01 and recent_mean > 0.8:
                     # High coherence plateau
                     coherence_level = CoherenceLevel.HIGH_COHERENCE
-                elif np.std(recent) > 0.1:
+                elif recent_std > 0.1:
                     # Transition state
                     coherence_level = CoherenceLevel.MEDIUM_COHERENCE
                 else:
@@ -295,7 +432,10 @@ class UnifiedFieldSystem:
                     })
                 
                 coherence_levels.append(coherence_level)
-        
+
+        if trajectory is not None:
+            results['state_trajectory'] = trajectory
+
         return results
 
 # =========================
@@ -307,14 +447,14 @@ class PhysicsSubsystem:
     
     def __init__(self):
         # Quantum state (complex amplitudes)
-        self.state = np.random.randn(10, 10) + 1j * np.random.randn(10, 10)
+        self.state = (np.random.randn(10, 10) + 1j * np.random.randn(10, 10)).astype(CDTYPE)
         self.state = self.state / np.linalg.norm(self.state)
         
         # Classical parameters
-        self.classical_params = np.random.randn(5)
+        self.classical_params = np.random.randn(5).astype(DTYPE)
         
         # Entanglement matrix
-        self.entanglement = np.eye(10)
+        self.entanglement = np.eye(10, dtype=DTYPE)
         
     def get_state(self) -> np.ndarray:
         """Return current physics state"""
@@ -322,23 +462,33 @@ class PhysicsSubsystem:
         quantum_real = np.real(self.state).flatten()
         quantum_imag = np.imag(self.state).flatten()
         return np.concatenate([quantum_real, quantum_imag, self.classical_params])
-    
+
+    def get_state_into(self, out: np.ndarray):
+        """Write the state vector into a preallocated buffer"""
+        quantum_size = self.state.size
+        out[:quantum_size] = self.state.real.ravel()
+        out[quantum_size:2*quantum_size] = self.state.imag.ravel()
+        out[2*quantum_size:] = self.classical_params
+
     def update_state(self, new_state: np.ndarray):
         """Update physics state"""
         # This is a simplified update
         total_size = np.prod(self.state.shape) * 2 + len(self.classical_params)
         if len(new_state) == total_size:
-            # Split back into components
+            # Split back into components, writing the real/imag views of the
+            # existing complex array in place (no real + 1j*imag temporary)
             quantum_size = np.prod(self.state.shape)
-            quantum_real = new_state[:quantum_size].reshape(self.state.shape)
-            quantum_imag = new_state[quantum_size:2*quantum_size].reshape(self.state.shape)
-            self.state = quantum_real + 1j * quantum_imag
+            self.state.real[:] = new_state[:quantum_size].reshape(self.state.shape)
+            self.state.imag[:] = new_state[quantum_size:2*quantum_size].reshape(self.state.shape)
             self.classical_params = new_state[2*quantum_size:]
     
     def calculate_coherence(self) -> float:
         """Calculate physics coherence (quantum purity)"""
-        density_matrix = np.outer(self.state.flatten(), self.state.flatten().conj())
-        purity = np.trace(density_matrix @ density_matrix).real
+        # For a pure state tr((|psi><psi|)^2) = <psi|psi>^2, so there is no
+        # need to materialize the 100x100 density matrix
+        psi = self.state.ravel()
+        overlap = np.vdot(psi, psi).real
+        purity = overlap * overlap
         return min(purity, 1.0)
 
 class ConsciousnessSubsystem:
@@ -347,7 +497,7 @@ class ConsciousnessSubsystem:
     def __init__(self):
         # Brain state (simplified)
         self.brain_regions = 8
-        self.activation = np.random.randn(self.brain_regions)
+        self.activation = np.random.randn(self.brain_regions).astype(DTYPE)
         
         # Awareness levels
         self.awareness = {
@@ -365,7 +515,13 @@ class ConsciousnessSubsystem:
         """Return current consciousness state"""
         awareness_vector = np.array(list(self.awareness.values()))
         return np.concatenate([self.activation, awareness_vector, [self.meditation_depth]])
-    
+
+    def get_state_into(self, out: np.ndarray):
+        """Write the state vector into a preallocated buffer"""
+        out[:self.brain_regions] = self.activation
+        out[self.brain_regions:self.brain_regions+len(self.awareness)] = list(self.awareness.values())
+        out[-1] = self.meditation_depth
+
     def update_state(self, new_state: np.ndarray):
         """Update consciousness state"""
         total_size = self.brain_regions + len(self.awareness) + 1
@@ -378,17 +534,24 @@ class ConsciousnessSubsystem:
     
     def calculate_coherence(self) -> float:
         """Calculate consciousness coherence"""
-        # EEG-like coherence between brain regions
+        # EEG-like coherence between brain regions: closed-form Pearson
+        # against the shifted signal — np.corrcoef built (and averaged) a
+        # whole 2x2 matrix just to read this one off-diagonal value
         if len(self.activation) > 1:
-            correlation_matrix = np.corrcoef([self.activation, np.roll(self.activation, 1)])
-            coherence = np.mean(np.abs(correlation_matrix))
+            a = self.activation
+            b = np.roll(a, 1)
+            da = a - a.mean()
+            db = b - b.mean()
+            r = abs(float(da @ db)) / (math.sqrt(float(da @ da) * float(db @ db)) + 1e-12)
+            # Matches mean(|corrcoef|) of the 2x2 matrix: diagonal is 1
+            coherence = (1.0 + r) / 2.0
         else:
             coherence = 0.5
-        
+
         # Awareness balance
         awareness_values = list(self.awareness.values())
         awareness_balance = 1.0 - np.std(awareness_values)
-        
+
         return 0.7 * coherence + 0.3 * awareness_balance
 
 class AISubsystem:
@@ -396,8 +559,8 @@ class AISubsystem:
     
     def __init__(self):
         # Neural network weights (simplified)
-        self.layer1 = np.random.randn(10, 20)
-        self.layer2 = np.random.randn(20, 10)
+        self.layer1 = np.random.randn(10, 20).astype(DTYPE)
+        self.layer2 = np.random.randn(20, 10).astype(DTYPE)
         
         # Alignment metrics
         self.alignment = {
@@ -415,7 +578,16 @@ class AISubsystem:
         weights = np.concatenate([self.layer1.flatten(), self.layer2.flatten()])
         alignment_vector = np.array(list(self.alignment.values()))
         return np.concatenate([weights, alignment_vector, [self.learning_rate]])
-    
+
+    def get_state_into(self, out: np.ndarray):
+        """Write the state vector into a preallocated buffer"""
+        weight1_size = self.layer1.size
+        weight2_size = self.layer2.size
+        out[:weight1_size] = self.layer1.ravel()
+        out[weight1_size:weight1_size+weight2_size] = self.layer2.ravel()
+        out[weight1_size+weight2_size:weight1_size+weight2_size+len(self.alignment)] = list(self.alignment.values())
+        out[-1] = self.learning_rate
+
     def update_state(self, new_state: np.ndarray):
         """Update AI state"""
         weight1_size = np.prod(self.layer1.shape)
@@ -569,7 +741,8 @@ def run_unified_demo(steps: int = 200):
     
     print("\n🚀 Initializing Unified Field System...")
     print(f"Domains: {[d.value for d in Domain]}")
-    print(f"Initial coherence: {system.calculate_unified_coherence(system.state_history[-1] if system.state_history else None):.3f}")
+    if system.state_history:
+        print(f"Initial coherence: {system.calculate_unified_coherence(system.state_history[-1]):.3f}")
     
     # Run evolution
     print(f"\n⏱️ Running {steps} steps of unified evolution...")
@@ -606,15 +779,18 @@ def run_unified_demo(steps: int = 200):
     # Create visualization
     print("\n📈 Generating visualization...")
     fig = visualize_unified_field(results)
-    plt.savefig('unified_field_evolution.png', dpi=150)
+    fig.savefig('unified_field_evolution.png', dpi=150)
     print("✓ Visualization saved as 'unified_field_evolution.png'")
     
-    # Save results
+    # Save results — the numeric histories go to binary .npy (no per-float
+    # stringification, and far smaller on disk for long runs); JSON keeps
+    # only the small structured metadata
+    np.save('unified_field_coherence.npy', np.asarray(results['coherence_history']))
+    np.save('unified_field_energy.npy', np.asarray(results['energy_costs']))
+
     with open('unified_field_results.json', 'w') as f:
         json.dump({
-            'coherence_history': [float(x) for x in results['coherence_history']],
             'phase_transitions': results['phase_transitions'],
-            'energy_costs': [float(x) for x in results['energy_costs']],
             'final_coherence': float(results['coherence_history'][-1]),
             'regimes': stable_regimes
         }, f, indent=2)
@@ -629,22 +805,38 @@ def run_unified_demo(steps: int = 200):
 # UTILITY FUNCTIONS
 # =========================
 
-def _extract_patterns(self, array: np.ndarray) -> List[np.ndarray]:
+def _moments4(x: np.ndarray) -> np.ndarray:
+    """Mean, std, skewness and excess kurtosis from a single centering pass"""
+    x = x.ravel()
+    mean = x.mean()
+    centered = x - mean
+    variance = np.mean(centered * centered)
+    if variance <= 0:
+        return np.array([mean, 0.0, 0.0, 0.0])
+    std = np.sqrt(variance)
+    skewness = np.mean(centered ** 3) / (variance * std)
+    kurt = np.mean(centered ** 4) / (variance * variance) - 3.0
+    return np.array([mean, std, skewness, kurt])
+
+def _extract_patterns(array: np.ndarray) -> List[np.ndarray]:
     """Extract patterns from array using Fourier transform"""
     patterns = []
     
     # Fourier patterns
     if array.ndim == 1:
         fft = np.fft.fft(array)
-        patterns.append(np.abs(fft[:len(fft)//2]))  # Magnitude spectrum
-        patterns.append(np.angle(fft[:len(fft)//2]))  # Phase spectrum
+        half = fft[:len(fft)//2]
+        # Read the real/imag views directly — np.abs and np.angle on the
+        # complex array would each dispatch over and re-walk the buffer
+        patterns.append(np.hypot(half.real, half.imag))  # Magnitude spectrum
+        patterns.append(np.arctan2(half.imag, half.real))  # Phase spectrum
     
     # Statistical patterns
-    patterns.append(np.array([np.mean(array), np.std(array), np.skew(array.flatten()), np.kurtosis(array.flatten())]))
+    patterns.append(_moments4(array))
     
     return patterns
 
-def _pattern_alignment(self, patterns1: List[np.ndarray], patterns2: List[np.ndarray]) -> float:
+def _pattern_alignment(patterns1: List[np.ndarray], patterns2: List[np.ndarray]) -> float:
     """Calculate alignment between pattern sets"""
     if len(patterns1) != len(patterns2):
         return 0.0
@@ -660,39 +852,49 @@ def _pattern_alignment(self, patterns1: List[np.ndarray], patterns2: List[np.nda
     
     return np.mean(alignments) if alignments else 0.0
 
-def _resonance_amplification(self, source: np.ndarray, target: np.ndarray) -> np.ndarray:
+def _resonance_amplification(source: np.ndarray, target: np.ndarray) -> np.ndarray:
     """Amplify resonant frequencies"""
     if source.ndim == 1 and target.ndim == 1:
-        # Calculate resonant frequencies
-        source_fft = np.fft.fft(source)
-        target_fft = np.fft.fft(target)
-        
+        # Calculate resonant frequencies — the signals are real, so the
+        # half-spectrum rfft/irfft pair does the same job as fft/ifft at
+        # half the transform work, with no complex round-trip to discard
+        source_fft = np.fft.rfft(source)
+        target_fft = np.fft.rfft(target)
+
         # Find frequencies where both have high amplitude
         source_amp = np.abs(source_fft)
         target_amp = np.abs(target_fft)
-        
-        resonance_mask = (source_amp > np.median(source_amp)) & (target_amp > np.median(target_amp))
-        
+
+        # Domains have different sizes, so compare over the shared band only
+        band = min(len(source_amp), len(target_amp))
+        resonance_mask = np.zeros(len(target_amp), dtype=target_amp.dtype)
+        resonance_mask[:band] = ((source_amp[:band] > np.median(source_amp)) &
+                                 (target_amp[:band] > np.median(target_amp)))
+
         # Amplify resonant frequencies in target
-        amplification = np.fft.ifft(target_fft * (1 + 0.1 * resonance_mask)).real
+        amplification = np.fft.irfft(target_fft * (1 + 0.1 * resonance_mask), n=target.size)
         return amplification - target
-    
+
     return np.zeros_like(target)
 
 # Add missing imports
 import time
-from scipy.stats import skew, kurtosis
 
 # Add missing Governance, Mystery, and Social subsystems (simplified versions)
 class GovernanceSubsystem:
     def __init__(self):
-        self.consensus = np.random.randn(5)
-        self.trust_matrix = np.random.rand(5, 5)
+        self.consensus = np.random.randn(5).astype(DTYPE)
+        self.trust_matrix = np.random.rand(5, 5).astype(DTYPE)
         np.fill_diagonal(self.trust_matrix, 1.0)
     
     def get_state(self):
         return np.concatenate([self.consensus.flatten(), self.trust_matrix.flatten()])
-    
+
+    def get_state_into(self, out):
+        consensus_size = len(self.consensus)
+        out[:consensus_size] = self.consensus
+        out[consensus_size:] = self.trust_matrix.ravel()
+
     def update_state(self, new_state):
         total_size = len(self.consensus) + np.prod(self.trust_matrix.shape)
         if len(new_state) == total_size:
@@ -705,13 +907,20 @@ class GovernanceSubsystem:
 
 class MysterySubsystem:
     def __init__(self):
-        self.archetypes = np.random.randn(7)
-        self.symbolic_field = np.random.randn(3, 3)
+        self.archetypes = np.random.randn(7).astype(DTYPE)
+        self.symbolic_field = np.random.randn(3, 3).astype(DTYPE)
         self.initiation_level = 0.0
     
     def get_state(self):
         return np.concatenate([self.archetypes.flatten(), self.symbolic_field.flatten(), [self.initiation_level]])
-    
+
+    def get_state_into(self, out):
+        arch_size = len(self.archetypes)
+        sym_size = self.symbolic_field.size
+        out[:arch_size] = self.archetypes
+        out[arch_size:arch_size+sym_size] = self.symbolic_field.ravel()
+        out[-1] = self.initiation_level
+
     def update_state(self, new_state):
         total_size = len(self.archetypes) + np.prod(self.symbolic_field.shape) + 1
         if len(new_state) == total_size:
@@ -726,13 +935,20 @@ class MysterySubsystem:
 
 class SocialSubsystem:
     def __init__(self):
-        self.connection_matrix = np.random.rand(8, 8)
-        self.culture_vector = np.random.randn(4)
+        self.connection_matrix = np.random.rand(8, 8).astype(DTYPE)
+        self.culture_vector = np.random.randn(4).astype(DTYPE)
         self.collective_intention = 0.5
     
     def get_state(self):
         return np.concatenate([self.connection_matrix.flatten(), self.culture_vector.flatten(), [self.collective_intention]])
-    
+
+    def get_state_into(self, out):
+        conn_size = self.connection_matrix.size
+        cult_size = len(self.culture_vector)
+        out[:conn_size] = self.connection_matrix.ravel()
+        out[conn_size:conn_size+cult_size] = self.culture_vector
+        out[-1] = self.collective_intention
+
     def update_state(self, new_state):
         total_size = np.prod(self.connection_matrix.shape) + len(self.culture_vector) + 1
         if len(new_state) == total_size: